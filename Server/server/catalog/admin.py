@@ -12,6 +12,7 @@ class CategoryAdmin(admin.ModelAdmin):
 @admin.register(Subcategory)
 class SubcategoryAdmin(admin.ModelAdmin):
     list_display = ["name", "category", "created_at"]
+    list_select_related = ["category"]
     list_filter = ["category", "created_at"]
     search_fields = ["name"]
 
@@ -19,5 +20,7 @@ class SubcategoryAdmin(admin.ModelAdmin):
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
     list_display = ["name", "subcategory", "price", "created_at"]
+    # str(subcategory) включает название категории
+    list_select_related = ["subcategory__category"]
     list_filter = ["subcategory__category", "subcategory", "created_at"]
     search_fields = ["name", "description"]
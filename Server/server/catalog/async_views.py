@@ -0,0 +1,156 @@
+"""Асинхронные эндпоинты чтения каталога для бота.
+
+Маршруты подключаются в catalog/urls.py раньше роутера DRF и отвечают в том
+же формате, что и соответствующие действия ViewSet-ов. Запросы к базе идут
+через асинхронный ORM, без обёрток async_to_sync.
+"""
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import ValidationError
+
+from utils.async_api import (
+    InvalidPage,
+    get_page_size,
+    json_response,
+    not_found,
+    paginate,
+)
+from utils.conditional import aconditional_response, counter_version
+from .models import Category, Subcategory, Product
+from .pagination import (
+    ProductKeysetPagination,
+    ProductSearchPagination,
+    StandardResultsSetPagination,
+)
+from .search import search_products
+from .serializers import CategorySerializer, SubcategorySerializer, ProductSerializer
+
+
+def _page_size(request):
+    return get_page_size(
+        request,
+        StandardResultsSetPagination.page_size,
+        StandardResultsSetPagination.page_size_query_param,
+        StandardResultsSetPagination.max_page_size,
+    )
+
+
+@require_GET
+async def category_list(request):
+    queryset = Category.objects.all()
+
+    async def build_response():
+        try:
+            categories, meta = await paginate(request, queryset, _page_size(request))
+        except InvalidPage:
+            return not_found()
+        serializer = CategorySerializer(
+            categories, many=True, context={"request": request}
+        )
+        return json_response({**meta, "results": serializer.data})
+
+    return await aconditional_response(request, queryset, build_response)
+
+
+@require_GET
+async def category_subcategories(request, pk):
+    if not await Category.objects.filter(pk=pk).aexists():
+        return not_found()
+    queryset = Subcategory.objects.filter(category_id=pk)
+
+    async def build_response():
+        subcategories = [subcategory async for subcategory in queryset]
+        serializer = SubcategorySerializer(
+            subcategories, many=True, context={"request": request}
+        )
+        return json_response(serializer.data)
+
+    return await aconditional_response(request, queryset, build_response)
+
+
+@require_GET
+async def subcategory_products(request, pk):
+    subcategory = (
+        await Subcategory.objects.filter(pk=pk)
+        .only("products_version", "products_updated_at")
+        .afirst()
+    )
+    if subcategory is None:
+        return not_found()
+    # Версия хранится в подкатегории: без MAX/COUNT по всем её товарам
+    version = counter_version(
+        f"s{pk}", subcategory.products_version, subcategory.products_updated_at
+    )
+    queryset = Product.objects.filter(subcategory_id=pk).order_by("name", "id")
+    page_size = _page_size(request)
+
+    async def build_cursor_response():
+        paginator = ProductKeysetPagination(page_size)
+        try:
+            page = await paginator.apaginate_queryset(queryset, request.GET["cursor"])
+        except ValidationError as e:
+            return json_response(e.detail, status=400)
+        serializer = ProductSerializer(page, many=True, context={"request": request})
+        return json_response(
+            {"results": {"items": serializer.data, "next_cursor": paginator.next_cursor}}
+        )
+
+    async def build_page_response():
+        try:
+            products, meta = await paginate(request, queryset, page_size)
+        except InvalidPage:
+            return not_found()
+        serializer = ProductSerializer(products, many=True, context={"request": request})
+        return json_response(
+            {
+                **meta,
+                "results": {
+                    "items": serializer.data,
+                    "total": meta["count"],
+                    "pages": max(1, (meta["count"] + page_size - 1) // page_size),
+                },
+            }
+        )
+
+    if "cursor" in request.GET:
+        return await aconditional_response(
+            request, queryset, build_cursor_response, version
+        )
+    return await aconditional_response(request, queryset, build_page_response, version)
+
+
+@require_GET
+async def product_detail(request, pk):
+    queryset = Product.objects.filter(pk=pk)
+
+    async def build_response():
+        product = await queryset.afirst()
+        if product is None:
+            return not_found()
+        return json_response(ProductSerializer(product, context={"request": request}).data)
+
+    return await aconditional_response(request, queryset, build_response)
+
+
+@require_GET
+async def product_search(request):
+    """Полнотекстовый поиск товаров: ?q=, ?page=, ?limit=.
+
+    Результаты упорядочены по релевантности, формат ответа — как у списка
+    категорий (count/next/previous/results).
+    """
+    text = request.GET.get("q", "").strip()
+    if not text:
+        return json_response({"q": ["Обязательный параметр."]}, status=400)
+    queryset = search_products(Product.objects.all(), text)
+    page_size = get_page_size(
+        request,
+        ProductSearchPagination.page_size,
+        ProductSearchPagination.page_size_query_param,
+        ProductSearchPagination.max_page_size,
+    )
+    try:
+        products, meta = await paginate(request, queryset, page_size)
+    except InvalidPage:
+        return not_found()
+    serializer = ProductSerializer(products, many=True, context={"request": request})
+    return json_response({**meta, "results": serializer.data})
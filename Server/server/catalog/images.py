@@ -0,0 +1,166 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .models import Category, Subcategory, Product
+
+logger = logging.getLogger(__name__)
+
+# Варианты изображений: имя -> максимальные размеры (ширина, высота)
+IMAGE_VARIANTS = {
+    "thumb": (320, 320),
+    "telegram": (1280, 1280),
+}
+VARIANT_QUALITY = 85
+
+_executor = None
+_slots = None
+_executor_lock = threading.Lock()
+
+
+def variant_name(name, variant):
+    """Имя файла варианта в хранилище: variants/<variant>/<путь оригинала>.jpg"""
+    path = PurePosixPath(name)
+    return str(PurePosixPath("variants", variant, path.parent, f"{path.stem}.jpg"))
+
+
+def render_variants(source_path, targets, force=False):
+    """Создание уменьшенных JPEG-вариантов файла.
+
+    Функция работает только с путями файловой системы и не обращается к Django,
+    поэтому её можно выполнять в отдельном процессе.
+
+    Args:
+        source_path: Путь к оригиналу.
+        targets: Список кортежей (путь варианта, (ширина, высота)).
+        force: Пересоздать уже существующие варианты.
+
+    Returns:
+        Количество созданных файлов.
+    """
+    pending = [t for t in targets if force or not os.path.exists(t[0])]
+    if not pending:
+        return 0
+    with Image.open(source_path) as original:
+        original = ImageOps.exif_transpose(original).convert("RGB")
+        for target_path, size in pending:
+            image = original.copy()
+            image.thumbnail(size, Image.LANCZOS)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            image.save(
+                target_path, "JPEG", quality=VARIANT_QUALITY, optimize=True, progressive=True
+            )
+    return len(pending)
+
+
+def variant_targets(name):
+    """Пути всех вариантов изображения в хранилище."""
+    return [
+        (default_storage.path(variant_name(name, variant)), size)
+        for variant, size in IMAGE_VARIANTS.items()
+    ]
+
+
+def get_executor():
+    """Пул потоков веб-процесса для генерации вариантов при сохранении моделей.
+
+    Pillow отпускает GIL при масштабировании и кодировании JPEG, поэтому
+    процесс сервера не форкается. Число ожидающих задач ограничено
+    IMAGE_VARIANT_QUEUE_SIZE.
+
+    Returns:
+        Кортеж (пул, семафор свободных мест в очереди).
+    """
+    global _executor, _slots
+    with _executor_lock:
+        if _executor is None:
+            workers = settings.IMAGE_VARIANT_WORKERS
+            _executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="image-variants"
+            )
+            _slots = threading.BoundedSemaphore(
+                workers + settings.IMAGE_VARIANT_QUEUE_SIZE
+            )
+    return _executor, _slots
+
+
+def schedule_variants(image_field):
+    """Фоновая генерация вариантов для поля ImageField.
+
+    Задача ставится, только если варианты ещё не созданы для текущего
+    изображения (image_variants_source), поэтому правка других полей записи
+    ничего не пересоздаёт. При заполненной очереди изображение пропускается:
+    его обработает команда generate_image_variants.
+    """
+    if not image_field or not image_field.name:
+        return
+    name, instance = image_field.name, image_field.instance
+    if getattr(instance, "image_variants_source", None) == name:
+        return
+    executor, slots = get_executor()
+    if not slots.acquire(blocking=False):
+        logger.warning(f"Очередь генерации вариантов заполнена, пропущено изображение {name}")
+        return
+    future = executor.submit(render_variants, image_field.path, variant_targets(name))
+    future.add_done_callback(_on_variants_done(image_field, slots))
+
+
+def _on_variants_done(image_field, slots):
+    name, instance = image_field.name, image_field.instance
+
+    def callback(future):
+        slots.release()
+        if future.exception():
+            logger.error(f"Не удалось создать варианты изображения {name}: {future.exception()}")
+            return
+        # Появились URL вариантов — ответ API изменился, обновляем версию (ETag).
+        # Если изображение успели заменить, отметку ставит генерация для нового
+        try:
+            type(instance).objects.filter(pk=instance.pk, image=name).update(
+                updated_at=timezone.now(), image_variants_source=name
+            )
+            if isinstance(instance, Product):
+                Subcategory.touch_products(instance.subcategory_id)
+        except Exception as e:
+            logger.error(f"Не удалось обновить версию {instance!r}: {e}")
+        finally:
+            connection.close()
+
+    return callback
+
+
+def variant_urls(image_field):
+    """Относительные URL вариантов изображения.
+
+    Наличие вариантов не проверяется в хранилище: после генерации в запись
+    сохраняется имя исходного изображения (image_variants_source), и URL
+    строятся, только если оно совпадает с текущим изображением.
+    """
+    if not image_field or not image_field.name:
+        return {}
+    instance = getattr(image_field, "instance", None)
+    if getattr(instance, "image_variants_source", None) != image_field.name:
+        return {}
+    return {
+        variant: default_storage.url(variant_name(image_field.name, variant))
+        for variant in IMAGE_VARIANTS
+    }
+
+
+def mark_variants_ready(name):
+    """Отметка о готовых вариантах у всех записей каталога с изображением name."""
+    for model in (Category, Subcategory, Product):
+        queryset = model.objects.filter(image=name).exclude(image_variants_source=name)
+        if model is Product:
+            Subcategory.touch_products(
+                *queryset.values_list("subcategory_id", flat=True).distinct()
+            )
+        queryset.update(updated_at=timezone.now(), image_variants_source=name)
@@ -0,0 +1,96 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from catalog.models import Category, Subcategory, Product
+from catalog.pagination import ProductKeysetPagination
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет время ответа /api/subcategories/<id>/products/ на первой, "
+        "средней и последней странице при росте подкатегории. Тестовые данные "
+        "создаются в транзакции и откатываются"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 50000],
+            help="Размеры подкатегории (количество товаров)",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Повторов на замер")
+        parser.add_argument("--limit", type=int, default=5, help="Размер страницы")
+
+    def _measure(self, client, url, params, repeat):
+        timings = []
+        response = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = client.get(url, params)
+            timings.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.status_code
+        return statistics.median(timings), response
+
+    def _deep_cursor(self, subcategory, offset):
+        # Курсор, указывающий на ту же глубину, что и средняя страница
+        products = Product.objects.filter(subcategory=subcategory).order_by("name", "id")
+        product = products[offset]
+        return ProductKeysetPagination.encode_cursor(product)
+
+    def _run(self, size, repeat, limit):
+        category = Category.objects.create(name="benchmark")
+        subcategory = Subcategory.objects.create(category=category, name="benchmark")
+        Product.objects.bulk_create(
+            (
+                Product(
+                    subcategory=subcategory,
+                    name=f"Товар {i:07d}",
+                    description="",
+                    price=100,
+                    image="",
+                )
+                for i in range(size)
+            ),
+            batch_size=5000,
+        )
+        Subcategory.touch_products(subcategory.id)
+        client = APIClient()
+        url = f"/api/subcategories/{subcategory.id}/products/"
+        pages = (size + limit - 1) // limit
+        row = {"size": size}
+        for label, page in (("first", 1), ("middle", pages // 2), ("last", pages)):
+            row[label], _ = self._measure(
+                client, url, {"page": page, "limit": limit}, repeat
+            )
+        cursor = self._deep_cursor(subcategory, (pages // 2) * limit)
+        row["cursor"], _ = self._measure(
+            client, url, {"cursor": cursor, "limit": limit}, repeat
+        )
+        return row
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'товаров':>10} {'первая':>10} {'средняя':>10} "
+            f"{'последняя':>10} {'курсор':>10}  (мс, медиана)"
+        )
+        for size in options["sizes"]:
+            try:
+                with transaction.atomic():
+                    row = self._run(size, options["repeat"], options["limit"])
+                    raise _Rollback
+            except _Rollback:
+                pass
+            self.stdout.write(
+                f"{row['size']:>10} {row['first']:>10.2f} {row['middle']:>10.2f} "
+                f"{row['last']:>10.2f} {row['cursor']:>10.2f}"
+            )
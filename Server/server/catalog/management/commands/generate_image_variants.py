@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from catalog.images import mark_variants_ready, render_variants, variant_targets
+from catalog.models import Category, Subcategory, Product
+
+
+class Command(BaseCommand):
+    help = "Создаёт уменьшенные варианты изображений каталога в пуле процессов"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action="store_true", help="Пересоздать существующие варианты"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.IMAGE_VARIANT_WORKERS,
+            help="Количество процессов",
+        )
+
+    def handle(self, *args, **options):
+        names = set()
+        for model in (Category, Subcategory, Product):
+            names.update(
+                model.objects.exclude(image="")
+                .exclude(image__isnull=True)
+                .values_list("image", flat=True)
+            )
+
+        created, failed = 0, 0
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {
+                executor.submit(
+                    render_variants,
+                    default_storage.path(name),
+                    variant_targets(name),
+                    options["force"],
+                ): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                try:
+                    created += future.result()
+                    mark_variants_ready(futures[future])
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{futures[future]}: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Изображений: {len(names)}, создано вариантов: {created}, ошибок: {failed}"
+            )
+        )
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['subcategory', 'name', 'id'], name='product_subcat_name_id'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0002_product_subcategory_name_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="Дата обновления",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="subcategory",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="Дата обновления",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="Дата обновления",
+            ),
+            preserve_default=False,
+        ),
+    ]
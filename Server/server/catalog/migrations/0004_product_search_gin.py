@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:48
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='russian', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='russian', weight='B'), django.contrib.postgres.search.SearchConfig('russian')), name='product_search_gin'),
+        ),
+    ]
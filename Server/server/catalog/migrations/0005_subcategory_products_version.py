@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:02
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+
+def fill_products_updated_at(apps, schema_editor):
+    Subcategory = apps.get_model("catalog", "Subcategory")
+    Product = apps.get_model("catalog", "Product")
+    last_modified = (
+        Product.objects.filter(subcategory_id=OuterRef("pk"))
+        .order_by()
+        .values("subcategory_id")
+        .annotate(last=Max("updated_at"))
+        .values("last")
+    )
+    Subcategory.objects.update(products_updated_at=Subquery(last_modified))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_product_search_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subcategory',
+            name='products_updated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Изменение товаров'),
+        ),
+        migrations.AddField(
+            model_name='subcategory',
+            name='products_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Версия списка товаров'),
+        ),
+        migrations.RunPython(fill_products_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:03
+
+from django.db import migrations, models
+
+
+def fill_image_variants_source(apps, schema_editor):
+    # Однократная проверка хранилища для уже созданных вариантов
+    from django.core.files.storage import default_storage
+
+    from catalog.images import IMAGE_VARIANTS, variant_name
+
+    for model_name in ("Category", "Subcategory", "Product"):
+        model = apps.get_model("catalog", model_name)
+        names = (
+            model.objects.exclude(image="")
+            .exclude(image__isnull=True)
+            .values_list("image", flat=True)
+            .distinct()
+        )
+        for name in names:
+            if all(
+                default_storage.exists(variant_name(name, variant))
+                for variant in IMAGE_VARIANTS
+            ):
+                model.objects.filter(image=name).update(image_variants_source=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_subcategory_products_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='image_variants_source',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='Варианты изображения'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='image_variants_source',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='Варианты изображения'),
+        ),
+        migrations.AddField(
+            model_name='subcategory',
+            name='image_variants_source',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='Варианты изображения'),
+        ),
+        migrations.RunPython(fill_image_variants_source, migrations.RunPython.noop),
+    ]
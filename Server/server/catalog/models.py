@@ -1,13 +1,23 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from django.utils.text import slugify
 
+from .search import product_search_vector
+
 
 class Category(models.Model):
     name = models.CharField(max_length=100, verbose_name="Название категории")
     image = models.ImageField(
         upload_to="categories/", blank=True, null=True, verbose_name="Изображение"
     )
+    # Имя изображения, для которого созданы варианты (см. images.variant_urls)
+    image_variants_source = models.CharField(
+        max_length=100, blank=True, editable=False, verbose_name="Варианты изображения"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
 
     class Meta:
         verbose_name = "Категория"
@@ -29,7 +39,20 @@ class Subcategory(models.Model):
     image = models.ImageField(
         upload_to="subcategories/", blank=True, null=True, verbose_name="Изображение"
     )
+    # Имя изображения, для которого созданы варианты (см. images.variant_urls)
+    image_variants_source = models.CharField(
+        max_length=100, blank=True, editable=False, verbose_name="Варианты изображения"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+    # Версия списка товаров подкатегории для ETag: увеличивается при любом
+    # изменении её товаров, поэтому страницы не требуют агрегатов по товарам
+    products_version = models.PositiveBigIntegerField(
+        default=0, editable=False, verbose_name="Версия списка товаров"
+    )
+    products_updated_at = models.DateTimeField(
+        null=True, blank=True, editable=False, verbose_name="Изменение товаров"
+    )
 
     class Meta:
         verbose_name = "Подкатегория"
@@ -39,6 +62,18 @@ class Subcategory(models.Model):
     def __str__(self):
         return f"{self.category.name} - {self.name}"
 
+    @classmethod
+    def touch_products(cls, *subcategory_ids):
+        """Новая версия списка товаров подкатегорий.
+
+        Вызывается сигналами Product. Массовые операции (QuerySet.update,
+        bulk_create) сигналов не отправляют и должны вызывать метод сами.
+        """
+        cls.objects.filter(pk__in=[pk for pk in subcategory_ids if pk]).update(
+            products_version=F("products_version") + 1,
+            products_updated_at=timezone.now(),
+        )
+
 
 class Product(models.Model):
     subcategory = models.ForeignKey(
@@ -51,12 +86,25 @@ class Product(models.Model):
     description = models.TextField(verbose_name="Описание товара")
     price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Цена")
     image = models.ImageField(upload_to="products/", verbose_name="Изображение")
+    # Имя изображения, для которого созданы варианты (см. images.variant_urls)
+    image_variants_source = models.CharField(
+        max_length=100, blank=True, editable=False, verbose_name="Варианты изображения"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
 
     class Meta:
         verbose_name = "Товар"
         verbose_name_plural = "Товары"
         ordering = ["name"]
+        indexes = [
+            # Страницы товаров подкатегории: фильтр + сортировка без Sort
+            models.Index(
+                fields=["subcategory", "name", "id"], name="product_subcat_name_id"
+            ),
+            # Полнотекстовый поиск: выражение совпадает с запросом в search.py
+            GinIndex(product_search_vector(), name="product_search_gin"),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,69 @@
+import base64
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 5
+    page_size_query_param = "limit"
+    max_page_size = 20
+
+
+class ProductSearchPagination(PageNumberPagination):
+    # Telegram показывает не больше 50 результатов inline-запроса
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 50
+
+
+class ProductKeysetPagination:
+    """Курсорная (keyset) пагинация товаров по (name, id).
+
+    Следующая страница выбирается условием WHERE (name, id) > последнего
+    элемента, поэтому время ответа не зависит от глубины страницы, в отличие
+    от OFFSET. Общее количество не считается.
+    """
+
+    cursor_query_param = "cursor"
+    ordering = ("name", "id")
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    @staticmethod
+    def encode_cursor(product):
+        raw = json.dumps([product.name, product.id], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            name, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return str(name), int(pk)
+        except (ValueError, TypeError):
+            raise ValidationError({"cursor": "Некорректный курсор"})
+
+    def _page_queryset(self, queryset, cursor):
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            name, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(Q(name__gt=name) | Q(name=name, id__gt=pk))
+        # Лишний элемент показывает, есть ли следующая страница
+        return queryset[: self.page_size + 1]
+
+    def _finish_page(self, page):
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        self.next_cursor = self.encode_cursor(page[-1]) if self.has_next else None
+        return page
+
+    def paginate_queryset(self, queryset, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        return self._finish_page(list(self._page_queryset(queryset, cursor)))
+
+    async def apaginate_queryset(self, queryset, cursor):
+        page = [obj async for obj in self._page_queryset(queryset, cursor)]
+        return self._finish_page(page)
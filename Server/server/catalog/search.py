@@ -0,0 +1,52 @@
+"""Полнотекстовый поиск товаров средствами PostgreSQL.
+
+Поиск идёт по выражению product_search_vector(): по нему же построен
+GIN-индекс product_search_gin (см. Product.Meta.indexes), поэтому условие
+@@ выполняется по индексу, без отдельного столбца tsvector и триггеров.
+Выражение в индексе и в запросе должно совпадать до символа.
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F
+
+SEARCH_CONFIG = "russian"
+
+# Ограничение на число слов в запросе: длинный tsquery не улучшает поиск
+MAX_QUERY_WORDS = 8
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def product_search_vector():
+    """tsvector товара: название (вес A) и описание (вес B)."""
+    return SearchVector("name", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "description", weight="B", config=SEARCH_CONFIG
+    )
+
+
+def build_search_query(text):
+    """tsquery из пользовательского ввода или None, если слов нет.
+
+    Слова объединяются через &, последнее ищется по префиксу (:*), чтобы
+    результаты появлялись по мере набора. В to_tsquery передаются только
+    буквы и цифры, поэтому спецсимволы tsquery из ввода не проходят.
+    """
+    words = _WORD_RE.findall(text.lower())[:MAX_QUERY_WORDS]
+    if not words:
+        return None
+    terms = words[:-1] + [f"{words[-1]}:*"]
+    return SearchQuery(" & ".join(terms), search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_products(queryset, text):
+    """Товары, найденные по запросу, в порядке релевантности."""
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+    return (
+        queryset.alias(search=product_search_vector())
+        .filter(search=query)
+        .annotate(rank=SearchRank(F("search"), query))
+        .order_by("-rank", "id")
+    )
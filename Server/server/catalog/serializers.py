@@ -1,7 +1,21 @@
 from rest_framework import serializers
+from .images import variant_urls
 from .models import Category, Subcategory, Product
 
 
+def _absolute_url(request, url):
+    if request:
+        return request.build_absolute_uri(url)
+    return f"http://backend_api:8000{url}"
+
+
+def _image_variants(request, image):
+    return {
+        variant: _absolute_url(request, url)
+        for variant, url in variant_urls(image).items()
+    }
+
+
 class ProductSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
@@ -9,7 +23,7 @@ class ProductSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
-        rep["subcategory_id"] = instance.subcategory.id
+        rep["subcategory_id"] = instance.subcategory_id
         request = self.context.get("request")
         if instance.image and instance.image.url:
             if request:
@@ -25,6 +39,7 @@ class ProductSerializer(serializers.ModelSerializer):
                 rep["image_url"] = (
                     "http://backend_api:8000/static/images/default_product_image.jpg"
                 )
+        rep["image_variants"] = _image_variants(request, instance.image)
         return rep
 
 
@@ -35,13 +50,14 @@ class SubcategorySerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
-        rep["category_id"] = instance.category.id
+        rep["category_id"] = instance.category_id
         request = self.context.get("request")
         if instance.image and instance.image.url:
             if request:
                 rep["image_url"] = request.build_absolute_uri(instance.image.url)
             else:
                 rep["image_url"] = f"http://backend_api:8000{instance.image.url}"
+        rep["image_variants"] = _image_variants(request, instance.image)
         return rep
 
 
@@ -58,4 +74,5 @@ class CategorySerializer(serializers.ModelSerializer):
                 rep["image_url"] = request.build_absolute_uri(instance.image.url)
             else:
                 rep["image_url"] = f"http://backend_api:8000{instance.image.url}"
+        rep["image_variants"] = _image_variants(request, instance.image)
         return rep
@@ -0,0 +1,42 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .images import schedule_variants
+from .models import Category, Subcategory, Product
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Subcategory)
+@receiver(post_save, sender=Product)
+def generate_image_variants(sender, instance, raw=False, **kwargs):
+    """Генерация вариантов нового изображения после сохранения (кроме loaddata)."""
+    if raw:
+        return
+    transaction.on_commit(lambda: schedule_variants(instance.image))
+
+
+@receiver(pre_save, sender=Product)
+def remember_subcategory(sender, instance, raw=False, **kwargs):
+    """Прежняя подкатегория товара: при переносе меняются версии обеих."""
+    if raw or instance.pk is None:
+        instance._previous_subcategory_id = None
+        return
+    instance._previous_subcategory_id = (
+        Product.objects.filter(pk=instance.pk)
+        .values_list("subcategory_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def touch_subcategory_products(sender, instance, raw=False, **kwargs):
+    """Новая версия (ETag) списка товаров подкатегории."""
+    if raw:
+        return
+    previous = getattr(instance, "_previous_subcategory_id", None)
+    Subcategory.touch_products(
+        instance.subcategory_id,
+        *([previous] if previous != instance.subcategory_id else []),
+    )
@@ -0,0 +1,127 @@
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from . import images
+from .models import Category, Subcategory, Product
+
+
+class QueryCountMixin:
+    """Число SQL-запросов эндпоинта не должно зависеть от размера страницы."""
+
+    def count_queries(self, url, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(context)
+
+    def assertQueriesIndependentOfPageSize(self, url, expected, small=2, large=10):
+        counts = [self.count_queries(url, limit=size) for size in (small, large)]
+        self.assertEqual(counts, [expected, expected])
+
+
+class CatalogQueryCountTests(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="Категория")
+        for i in range(12):
+            Category.objects.create(name=f"Категория {i:02d}")
+            Subcategory.objects.create(category=cls.category, name=f"Подкатегория {i:02d}")
+        cls.subcategory = Subcategory.objects.filter(category=cls.category).first()
+        for i in range(12):
+            name = f"products/product-{i}.jpg"
+            Product.objects.create(
+                subcategory=cls.subcategory,
+                name=f"Товар {i:02d}",
+                description="",
+                price=100,
+                image=name,
+                image_variants_source=name,
+            )
+
+    def setUp(self):
+        # Варианты изображений строятся без обращения к хранилищу
+        patcher = mock.patch.object(
+            default_storage, "exists", side_effect=AssertionError("storage.exists")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_category_list(self):
+        # Версия (ETag), COUNT и страница
+        self.assertQueriesIndependentOfPageSize("/api/categories/", 3)
+
+    def test_subcategory_list(self):
+        self.assertQueriesIndependentOfPageSize("/api/subcategories/", 3)
+
+    def test_category_subcategories(self):
+        # Проверка категории, версия и выборка
+        self.assertEqual(
+            self.count_queries(f"/api/categories/{self.category.id}/subcategories/"), 3
+        )
+
+    def test_product_list(self):
+        self.assertQueriesIndependentOfPageSize("/api/products/", 3)
+
+    def test_subcategory_products_pages(self):
+        # Подкатегория (с версией), COUNT и страница
+        self.assertQueriesIndependentOfPageSize(
+            f"/api/subcategories/{self.subcategory.id}/products/", 3
+        )
+
+    def test_subcategory_products_cursor(self):
+        # Подкатегория (с версией) и страница, без COUNT
+        url = f"/api/subcategories/{self.subcategory.id}/products/"
+        counts = [
+            self.count_queries(url, limit=size, cursor="") for size in (2, 10)
+        ]
+        self.assertEqual(counts, [2, 2])
+
+    def test_product_image_variants(self):
+        response = self.client.get(f"/api/products/{Product.objects.first().id}/")
+        self.assertEqual(set(response.json()["image_variants"]), {"thumb", "telegram"})
+
+
+class ImageVariantScheduleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Категория")
+        subcategory = Subcategory.objects.create(category=category, name="Подкатегория")
+        cls.product = Product.objects.create(
+            subcategory=subcategory,
+            name="Товар",
+            description="",
+            price=100,
+            image="products/product.jpg",
+            image_variants_source="products/product.jpg",
+        )
+
+    def setUp(self):
+        self.executor = mock.Mock()
+        slots = mock.Mock(**{"acquire.return_value": True})
+        patcher = mock.patch.object(
+            images, "get_executor", return_value=(self.executor, slots)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save_product(self, **fields):
+        product = Product.objects.get(pk=self.product.pk)
+        for name, value in fields.items():
+            setattr(product, name, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+    def test_other_fields_do_not_render_variants(self):
+        self.save_product(price=200)
+        self.executor.submit.assert_not_called()
+
+    def test_new_image_renders_missing_variants(self):
+        self.save_product(image="products/other.jpg")
+        self.executor.submit.assert_called_once()
+        func, source_path, targets = self.executor.submit.call_args.args
+        self.assertIs(func, images.render_variants)
+        self.assertEqual(len(targets), len(images.IMAGE_VARIANTS))
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from . import async_views
 from .views import CategoryViewSet, SubcategoryViewSet, ProductViewSet
 
 router = DefaultRouter()
@@ -8,5 +9,13 @@ router.register("subcategories", SubcategoryViewSet, basename="subcategories")
 router.register("products", ProductViewSet, basename="products")
 
 urlpatterns = [
+    # Асинхронные эндпоинты чтения для бота — раньше маршрутов роутера
+    path("categories/", async_views.category_list),
+    path(
+        "categories/<int:pk>/subcategories/", async_views.category_subcategories
+    ),
+    path("subcategories/<int:pk>/products/", async_views.subcategory_products),
+    path("products/search/", async_views.product_search),
+    path("products/<int:pk>/", async_views.product_detail),
     path("", include(router.urls)),
 ]
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "catalog",
     "faq",
@@ -139,6 +140,24 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Генерация вариантов изображений каталога: потоки веб-процесса при сохранении
+# записей и процессы команды generate_image_variants
+IMAGE_VARIANT_WORKERS = env.int("IMAGE_VARIANT_WORKERS", default=2)
+# Максимум ожидающих задач в веб-процессе; остальное — командой generate_image_variants
+IMAGE_VARIANT_QUEUE_SIZE = env.int("IMAGE_VARIANT_QUEUE_SIZE", default=50)
+
+# Redis бота: через pub/sub бот узнаёт об изменениях FAQ
+REDIS_URL = env("REDIS_URL", default="redis://redis:6379/0")
+FAQ_INVALIDATION_CHANNEL = env("FAQ_INVALIDATION_CHANNEL", default="faq:invalidate")
+
+# Рассылки из админки. Лимит Telegram — около 30 сообщений в секунду на бота,
+# по умолчанию оставляем запас для сообщений, которые бот отправляет сам
+BROADCAST_RATE_LIMIT = env.float("BROADCAST_RATE_LIMIT", default=25)
+BROADCAST_CONCURRENCY = env.int("BROADCAST_CONCURRENCY", default=10)
+BROADCAST_MAX_RETRIES = env.int("BROADCAST_MAX_RETRIES", default=3)
+BROADCAST_REQUEST_TIMEOUT = env.float("BROADCAST_REQUEST_TIMEOUT", default=10)
+BROADCAST_PROGRESS_INTERVAL = env.float("BROADCAST_PROGRESS_INTERVAL", default=2)
+
 if DEBUG:
     MIDDLEWARE += ["django.middleware.common.CommonMiddleware"]
 
@@ -0,0 +1,24 @@
+"""Асинхронный эндпоинт списка FAQ для бота (формат как у FAQViewSet)."""
+from django.conf import settings
+from django.views.decorators.http import require_GET
+
+from utils.async_api import InvalidPage, json_response, not_found, paginate
+from utils.conditional import aconditional_response
+from .models import FAQ
+from .serializers import FAQSerializer
+
+
+@require_GET
+async def faq_list(request):
+    queryset = FAQ.objects.all()
+
+    async def build_response():
+        try:
+            faqs, meta = await paginate(
+                request, queryset, settings.REST_FRAMEWORK["PAGE_SIZE"]
+            )
+        except InvalidPage:
+            return not_found()
+        return json_response({**meta, "results": FAQSerializer(faqs, many=True).data})
+
+    return await aconditional_response(request, queryset, build_response)
@@ -0,0 +1,43 @@
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FAQ
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2
+        )
+    return _client
+
+
+def publish_faq_changed(faq_id):
+    """Уведомление ботов об изменении FAQ через Redis pub/sub."""
+    try:
+        _redis().publish(
+            settings.FAQ_INVALIDATION_CHANNEL, json.dumps({"faq_id": faq_id})
+        )
+    except redis.RedisError as e:
+        # Недоступный Redis не должен ломать админку: боты обновятся по TTL
+        logger.warning(f"Не удалось отправить инвалидацию FAQ {faq_id}: {e}")
+
+
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+def faq_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    faq_id = instance.pk
+    transaction.on_commit(lambda: publish_faq_changed(faq_id))
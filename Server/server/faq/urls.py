@@ -1,10 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from . import async_views
 from .views import FAQViewSet
 
 router = DefaultRouter()
 router.register(r"faq", FAQViewSet, basename="faq")
 
 urlpatterns = [
+    # Асинхронный эндпоинт чтения для бота — раньше маршрутов роутера
+    path("faq/", async_views.faq_list),
     path("", include(router.urls)),
 ]
@@ -0,0 +1,33 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def fill_external_ids(apps, schema_editor):
+    Order = apps.get_model("order", "Order")
+    for order in Order.objects.filter(external_id__isnull=True).only("id"):
+        order.external_id = uuid.uuid4()
+        order.save(update_fields=["external_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="external_id",
+            field=models.UUIDField(null=True, verbose_name="Внешний ID (из бота)"),
+        ),
+        migrations.RunPython(fill_external_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="order",
+            name="external_id",
+            field=models.UUIDField(
+                default=uuid.uuid4, unique=True, verbose_name="Внешний ID (из бота)"
+            ),
+        ),
+    ]
@@ -1,9 +1,14 @@
+import uuid
+
 from django.db import models
 
 from catalog.models import Product
 
 
 class Order(models.Model):
+    external_id = models.UUIDField(
+        default=uuid.uuid4, unique=True, verbose_name="Внешний ID (из бота)"
+    )
     user_id = models.BigIntegerField(verbose_name="ID пользователя в Telegram")
     total = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Итого")
     name = models.CharField(max_length=255, verbose_name="Имя")
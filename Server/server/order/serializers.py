@@ -19,6 +19,7 @@ class OrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = [
             "id",
+            "external_id",
             "user_id",
             "total",
             "name",
@@ -35,3 +36,22 @@ class OrderSerializer(serializers.ModelSerializer):
         for item_data in items_data:
             OrderItem.objects.create(order=order, **item_data)
         return order
+
+
+class OrderBulkItemSerializer(serializers.Serializer):
+    product_id = serializers.IntegerField()
+    quantity = serializers.IntegerField(min_value=1)
+    price = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class OrderBulkSerializer(serializers.Serializer):
+    """Заказ из очереди бота; external_id служит ключом идемпотентности."""
+
+    external_id = serializers.UUIDField()
+    user_id = serializers.IntegerField()
+    total = serializers.DecimalField(max_digits=10, decimal_places=2)
+    name = serializers.CharField(max_length=255)
+    address = serializers.CharField()
+    phone = serializers.CharField(max_length=20)
+    status = serializers.CharField(max_length=20, default="pending")
+    items = OrderBulkItemSerializer(many=True)
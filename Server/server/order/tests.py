@@ -1,3 +1,52 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from catalog.models import Category, Subcategory, Product
+from .models import Order, OrderItem
+
+
+class OrderQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Категория")
+        subcategory = Subcategory.objects.create(category=category, name="Подкатегория")
+        cls.products = [
+            Product.objects.create(
+                subcategory=subcategory,
+                name=f"Товар {i}",
+                description="",
+                price=100,
+                image="",
+            )
+            for i in range(3)
+        ]
+
+    def create_orders(self, count):
+        for i in range(count):
+            order = Order.objects.create(
+                user_id=i,
+                total=300,
+                name="Имя",
+                address="Адрес",
+                phone="+70000000000",
+            )
+            OrderItem.objects.bulk_create(
+                OrderItem(order=order, product=product, quantity=1, price=100)
+                for product in self.products
+            )
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/orders/")
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(context), len(response.json()["results"])
+
+    def test_order_list_query_count(self):
+        # COUNT, страница заказов, позиции и товары — независимо от числа заказов
+        self.create_orders(2)
+        small = self.count_queries()
+        self.create_orders(8)
+        large = self.count_queries()
+        self.assertEqual(small, (4, 2))
+        self.assertEqual(large, (4, 10))
@@ -1,27 +1,113 @@
-from rest_framework import viewsets
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
-from asgiref.sync import sync_to_async, async_to_sync
-from .serializers import OrderSerializer
-from .models import Order
+from django.db import IntegrityError, transaction
+from catalog.models import Product
+from .serializers import OrderSerializer, OrderBulkSerializer
+from .models import Order, OrderItem
 
 
 class OrderViewSet(viewsets.ModelViewSet):
     serializer_class = OrderSerializer
 
     def get_queryset(self):
-        @async_to_sync
-        async def fetch_orders():
-            return await sync_to_async(list)(Order.objects.all())
-
-        return fetch_orders()
+        # Позиции и их товары — двумя запросами на всю страницу заказов
+        return Order.objects.order_by("-id").prefetch_related("items__product")
 
     def create(self, request, *args, **kwargs):
-        @async_to_sync
-        async def perform_create_async(serializer):
-            await sync_to_async(self.perform_create)(serializer)
-
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        perform_create_async(serializer)
+        self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=201, headers=headers)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Пакетное создание заказов из очереди бота.
+
+        Повторная отправка заказа с тем же external_id ничего не создаёт,
+        поэтому бот может безопасно повторять пачку после ошибки. Заказы
+        с некорректными данными возвращаются в rejected и не блокируют
+        остальные.
+        """
+        orders_data = request.data.get("orders")
+        if not isinstance(orders_data, list):
+            return Response(
+                {"error": "orders must be a list"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        valid, rejected = [], []
+        for data in orders_data:
+            serializer = OrderBulkSerializer(data=data)
+            if serializer.is_valid():
+                valid.append(serializer.validated_data)
+            else:
+                rejected.append(
+                    {
+                        "external_id": data.get("external_id") if isinstance(data, dict) else None,
+                        "errors": serializer.errors,
+                    }
+                )
+
+        product_ids = {item["product_id"] for data in valid for item in data["items"]}
+        known_products = set(
+            Product.objects.filter(id__in=product_ids).values_list("id", flat=True)
+        )
+        existing = {
+            str(external_id)
+            for external_id in Order.objects.filter(
+                external_id__in=[data["external_id"] for data in valid]
+            ).values_list("external_id", flat=True)
+        }
+
+        new_orders = []
+        for data in valid:
+            external_id = str(data["external_id"])
+            if external_id in existing:
+                continue
+            unknown = [
+                item["product_id"]
+                for item in data["items"]
+                if item["product_id"] not in known_products
+            ]
+            if unknown:
+                rejected.append(
+                    {"external_id": external_id, "errors": {"unknown_products": unknown}}
+                )
+                continue
+            existing.add(external_id)
+            new_orders.append(data)
+
+        try:
+            with transaction.atomic():
+                orders = Order.objects.bulk_create(
+                    [
+                        Order(**{key: value for key, value in data.items() if key != "items"})
+                        for data in new_orders
+                    ]
+                )
+                OrderItem.objects.bulk_create(
+                    [
+                        OrderItem(
+                            order=order,
+                            product_id=item["product_id"],
+                            quantity=item["quantity"],
+                            price=item["price"],
+                        )
+                        for order, data in zip(orders, new_orders)
+                        for item in data["items"]
+                    ]
+                )
+        except IntegrityError:
+            # Та же пачка параллельно создаётся другим запросом: повторить позже
+            return Response(
+                {"error": "conflict, retry"}, status=status.HTTP_409_CONFLICT
+            )
+
+        return Response(
+            {
+                "created": [str(data["external_id"]) for data in new_orders],
+                "rejected": rejected,
+            },
+            status=status.HTTP_200_OK,
+        )
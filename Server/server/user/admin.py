@@ -3,9 +3,9 @@ from django import forms
 from django.contrib import messages
 from django.http import HttpResponseRedirect, HttpResponse
 from django.template import loader
-from django.urls import path
-from utils.message_sender import telegram_sender
-from .models import UserProfile
+from django.urls import path, reverse
+from .broadcast import start_broadcast
+from .models import Broadcast, UserProfile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,8 +24,10 @@ class UserProfileAdmin(admin.ModelAdmin):
     actions = ["send_broadcast_action"]
 
     def send_broadcast_action(self, request, queryset):
-        selected_ids = ",".join(str(obj.id) for obj in queryset)
-        return HttpResponseRedirect(f"/admin/user/userprofile/send_broadcast/?selected_ids={selected_ids}")
+        # Форма рендерится сразу: тысячи id не помещаются в URL редиректа
+        selected_ids = ",".join(str(pk) for pk in queryset.values_list("id", flat=True))
+        form = BroadcastForm(initial={"selected_ids": selected_ids})
+        return self.render_broadcast_form(request, form)
     send_broadcast_action.short_description = "📢 Отправить сообщение выбранным пользователям"
 
     def get_urls(self):
@@ -43,32 +45,63 @@ class UserProfileAdmin(admin.ModelAdmin):
             return self.render_broadcast_form(request, form)
 
         if request.method == "POST":
-            message_text = request.POST.get("message")
-            selected_ids = request.POST.get("selected_ids", "").split(",")
+            form = BroadcastForm(request.POST)
+            if not form.is_valid():
+                return self.render_broadcast_form(request, form)
+            selected_ids = [
+                pk for pk in form.cleaned_data["selected_ids"].split(",") if pk.isdigit()
+            ]
             users = UserProfile.objects.filter(id__in=selected_ids)
 
-            sent_count, failed_count = 0, 0
-
-            for user_profile in users:
-                if user_profile.telegram_id:
-                    success = telegram_sender.sync_send_message(user_profile.telegram_id, message_text)
-                    if success:
-                        sent_count += 1
-                    else:
-                        failed_count += 1
-                else:
-                    failed_count += 1
-
+            # Отправка идёт в фоне, прогресс виден на странице рассылки
+            broadcast = start_broadcast(
+                form.cleaned_data["message"], users, user=request.user
+            )
             self.message_user(
                 request,
-                f"📢 Рассылка завершена: отправлено {sent_count} сообщений, "
-                f"не отправлено {failed_count}.",
-                level=messages.SUCCESS if sent_count > 0 else messages.WARNING
+                f"📢 Рассылка {broadcast.id} запущена: {broadcast.total} получателей. "
+                "Прогресс обновляется на странице рассылки.",
+                level=messages.SUCCESS,
+            )
+            return HttpResponseRedirect(
+                reverse("admin:user_broadcast_change", args=[broadcast.id])
             )
-            return HttpResponseRedirect(request.get_full_path())
 
     def render_broadcast_form(self, request, form):
         """Исправлено: Теперь рендерим шаблон формы"""
         template = loader.get_template("admin/broadcast_form.html")
-        context = {"form": form}
+        context = {"form": form, **self.admin_site.each_context(request)}
         return HttpResponse(template.render(context, request))
+
+
+@admin.register(Broadcast)
+class BroadcastAdmin(admin.ModelAdmin):
+    list_display = ("id", "created_at", "status", "progress", "sent", "failed")
+    list_filter = ("status",)
+    readonly_fields = (
+        "text",
+        "status",
+        "progress",
+        "total",
+        "sent",
+        "failed",
+        "error",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+    fields = readonly_fields
+
+    @admin.display(description="Прогресс")
+    def progress(self, obj):
+        if not obj.total:
+            return "—"
+        return f"{obj.processed} из {obj.total} ({obj.processed * 100 // obj.total}%)"
+
+    def has_add_permission(self, request):
+        # Рассылки создаются действием в списке пользователей
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,171 @@
+"""Фоновая отправка рассылок из админки.
+
+Рассылка выполняется в отдельном потоке со своим циклом событий: запрос
+админки только создаёт запись Broadcast и сразу возвращает ответ. Сообщения
+отправляются несколькими корутинами через одну сессию aiohttp, общий темп
+ограничивает token bucket, ответы 429 приостанавливают всю отправку на
+retry_after. Прогресс периодически записывается в Broadcast и виден в админке.
+
+Незавершённая рассылка не возобновляется после перезапуска сервера.
+"""
+import asyncio
+import logging
+import threading
+
+import aiohttp
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from utils.message_sender import (
+    TelegramRetryAfter,
+    TelegramTemporaryError,
+    TokenBucket,
+    telegram_sender,
+)
+from .models import Broadcast
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastRunner:
+    """Отправка одной рассылки списку chat_id."""
+
+    def __init__(self, broadcast_id, text, chat_ids, sender=telegram_sender):
+        self.broadcast_id = broadcast_id
+        self.text = text
+        self.chat_ids = chat_ids
+        self.sender = sender
+        self.bucket = TokenBucket(settings.BROADCAST_RATE_LIMIT)
+        self.sent = 0
+        self.failed = 0
+
+    async def run(self):
+        queue = asyncio.Queue()
+        for chat_id in self.chat_ids:
+            queue.put_nowait(chat_id)
+
+        concurrency = settings.BROADCAST_CONCURRENCY
+        timeout = aiohttp.ClientTimeout(total=settings.BROADCAST_REQUEST_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            workers = [
+                asyncio.create_task(self._worker(session, queue))
+                for _ in range(min(concurrency, len(self.chat_ids)) or 1)
+            ]
+            reporter = asyncio.create_task(self._report_progress())
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                reporter.cancel()
+                for worker in workers:
+                    worker.cancel()
+
+    async def _worker(self, session, queue):
+        while True:
+            try:
+                chat_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if await self._deliver(session, chat_id):
+                self.sent += 1
+            else:
+                self.failed += 1
+
+    async def _deliver(self, session, chat_id):
+        """Отправка одному получателю с повторами при 429 и временных ошибках."""
+        for attempt in range(settings.BROADCAST_MAX_RETRIES + 1):
+            await self.bucket.acquire()
+            try:
+                return await self.sender.send_with_session(session, chat_id, self.text)
+            except TelegramRetryAfter as e:
+                logger.warning(
+                    f"Рассылка {self.broadcast_id}: лимит Telegram, пауза {e.retry_after} с"
+                )
+                self.bucket.pause(e.retry_after)
+            except TelegramTemporaryError as e:
+                logger.warning(
+                    f"Рассылка {self.broadcast_id}: временная ошибка для {chat_id}: {e}"
+                )
+                await asyncio.sleep(2**attempt)
+        return False
+
+    async def _report_progress(self):
+        while True:
+            await asyncio.sleep(settings.BROADCAST_PROGRESS_INTERVAL)
+            await self.save_progress()
+
+    async def save_progress(self, **fields):
+        await Broadcast.objects.filter(pk=self.broadcast_id).aupdate(
+            sent=self.sent, failed=self.failed, **fields
+        )
+
+
+def _run_broadcast(runner):
+    try:
+        asyncio.run(_run_and_save(runner))
+    except Exception as e:
+        logger.exception(f"Рассылка {runner.broadcast_id} прервана: {e}")
+        Broadcast.objects.filter(pk=runner.broadcast_id).update(
+            status=Broadcast.Status.FAILED,
+            error=str(e),
+            finished_at=timezone.now(),
+        )
+    finally:
+        connection.close()
+
+
+async def _run_and_save(runner):
+    await Broadcast.objects.filter(pk=runner.broadcast_id).aupdate(
+        status=Broadcast.Status.RUNNING, started_at=timezone.now()
+    )
+    try:
+        await runner.run()
+        await runner.save_progress(
+            status=Broadcast.Status.DONE, finished_at=timezone.now()
+        )
+        logger.info(
+            f"Рассылка {runner.broadcast_id} завершена: отправлено {runner.sent}, "
+            f"не отправлено {runner.failed}"
+        )
+    finally:
+        await sync_to_async(_close_connection)()
+
+
+def _close_connection():
+    # Асинхронный ORM работает в отдельном потоке asgiref — закрываем его соединение
+    connection.close()
+
+
+def start_broadcast(text, profiles, user=None):
+    """Создание рассылки и запуск отправки в фоновом потоке.
+
+    Args:
+        text: Текст сообщения.
+        profiles: QuerySet UserProfile выбранных получателей.
+        user: Автор рассылки.
+
+    Returns:
+        Созданный объект Broadcast.
+    """
+    telegram_ids = list(profiles.values_list("telegram_id", flat=True))
+    chat_ids = [telegram_id for telegram_id in telegram_ids if telegram_id]
+    broadcast = Broadcast.objects.create(
+        text=text,
+        total=len(telegram_ids),
+        # Профили без Telegram ID считаются неотправленными сразу
+        failed=len(telegram_ids) - len(chat_ids),
+        created_by=user,
+    )
+    runner = BroadcastRunner(broadcast.id, text, chat_ids)
+    runner.failed = broadcast.failed
+    thread = threading.Thread(
+        target=_run_broadcast,
+        args=(runner,),
+        name=f"broadcast-{broadcast.id}",
+        daemon=True,
+    )
+    transaction.on_commit(thread.start)
+    logger.info(f"Рассылка {broadcast.id} запущена: {len(chat_ids)} получателей")
+    return broadcast
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Broadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(verbose_name='Сообщение')),
+                ('status', models.CharField(choices=[('pending', 'Ожидает'), ('running', 'Отправляется'), ('done', 'Завершена'), ('failed', 'Прервана с ошибкой')], default='pending', max_length=20, verbose_name='Статус')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Всего получателей')),
+                ('sent', models.PositiveIntegerField(default=0, verbose_name='Отправлено')),
+                ('failed', models.PositiveIntegerField(default=0, verbose_name='Не отправлено')),
+                ('error', models.TextField(blank=True, verbose_name='Ошибка')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Начало отправки')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Окончание отправки')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Автор')),
+            ],
+            options={
+                'verbose_name': 'Рассылка',
+                'verbose_name_plural': 'Рассылки',
+                'ordering': ['-id'],
+            },
+        ),
+    ]
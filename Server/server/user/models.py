@@ -8,3 +8,47 @@ class UserProfile(models.Model):
 
     def __str__(self):
         return f"{self.user.username} (Telegram ID: {self.telegram_id})"
+
+
+class Broadcast(models.Model):
+    """Рассылка из админки; счётчики обновляет фоновый отправитель."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Ожидает"
+        RUNNING = "running", "Отправляется"
+        DONE = "done", "Завершена"
+        FAILED = "failed", "Прервана с ошибкой"
+
+    text = models.TextField(verbose_name="Сообщение")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Статус",
+    )
+    total = models.PositiveIntegerField(default=0, verbose_name="Всего получателей")
+    sent = models.PositiveIntegerField(default=0, verbose_name="Отправлено")
+    failed = models.PositiveIntegerField(default=0, verbose_name="Не отправлено")
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Автор",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Начало отправки")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Окончание отправки")
+
+    class Meta:
+        verbose_name = "Рассылка"
+        verbose_name_plural = "Рассылки"
+        ordering = ["-id"]
+
+    def __str__(self):
+        return f"Рассылка {self.id}"
+
+    @property
+    def processed(self):
+        return self.sent + self.failed
@@ -1,7 +1,9 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 from .models import UserProfile
 from .serializers import UserProfileSerializer
 
@@ -43,3 +45,44 @@ class UserProfileViewSet(viewsets.ModelViewSet):
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @action(detail=False, methods=["post"], url_path="register_bulk")
+    def register_bulk(self, request):
+        """Пакетная регистрация: создаёт профили для ещё не известных telegram_id"""
+        telegram_ids = list(
+            dict.fromkeys(str(t) for t in request.data.get("telegram_ids", []) if t)
+        )
+        if not telegram_ids:
+            return Response(
+                {"error": "telegram_ids is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        existing = set(
+            UserProfile.objects.filter(telegram_id__in=telegram_ids).values_list(
+                "telegram_id", flat=True
+            )
+        )
+        new_ids = [t for t in telegram_ids if t not in existing]
+        if new_ids:
+            usernames = {f"tg_{t}": t for t in new_ids}
+            with transaction.atomic():
+                User.objects.bulk_create(
+                    [
+                        User(username=username, password=make_password(None))
+                        for username in usernames
+                    ],
+                    ignore_conflicts=True,
+                )
+                users = User.objects.filter(username__in=usernames, profile__isnull=True)
+                UserProfile.objects.bulk_create(
+                    [
+                        UserProfile(user=user, telegram_id=usernames[user.username])
+                        for user in users
+                    ],
+                    ignore_conflicts=True,
+                )
+
+        return Response(
+            {"registered": telegram_ids, "created": len(new_ids)},
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,59 @@
+from django.http import JsonResponse
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class InvalidPage(Exception):
+    pass
+
+
+def get_page_size(request, default, query_param=None, max_page_size=None):
+    """Размер страницы из параметра запроса, как в PageNumberPagination."""
+    if not query_param:
+        return default
+    try:
+        size = int(request.GET[query_param])
+    except (KeyError, ValueError):
+        return default
+    if size <= 0:
+        return default
+    return min(size, max_page_size) if max_page_size else size
+
+
+async def paginate(request, queryset, page_size):
+    """Асинхронная постраничная выборка в формате PageNumberPagination DRF.
+
+    Возвращает (объекты страницы, {"count", "next", "previous"}). COUNT и
+    LIMIT/OFFSET выполняются в базе через асинхронный ORM.
+    """
+    page = request.GET.get("page", 1)
+    try:
+        page = int(page)
+    except (TypeError, ValueError):
+        raise InvalidPage
+    count = await queryset.acount()
+    num_pages = max(1, (count + page_size - 1) // page_size)
+    if page < 1 or page > num_pages:
+        raise InvalidPage
+
+    offset = (page - 1) * page_size
+    objects = [obj async for obj in queryset[offset:offset + page_size]]
+
+    url = request.build_absolute_uri()
+    next_link = replace_query_param(url, "page", page + 1) if page < num_pages else None
+    if page == 1:
+        previous_link = None
+    elif page == 2:
+        previous_link = remove_query_param(url, "page")
+    else:
+        previous_link = replace_query_param(url, "page", page - 1)
+    return objects, {"count": count, "next": next_link, "previous": previous_link}
+
+
+def json_response(data, status=200):
+    return JsonResponse(
+        data, status=status, safe=False, json_dumps_params={"ensure_ascii": False}
+    )
+
+
+def not_found(detail="Страница не найдена."):
+    return json_response({"detail": detail}, status=404)
@@ -0,0 +1,97 @@
+"""Условные GET-запросы (ETag / Last-Modified) для эндпоинтов чтения.
+
+Версия выборки вычисляется одним агрегирующим запросом — MAX(updated_at) и
+COUNT(*) — без сериализации данных. COUNT учитывает удаление записей,
+которое не меняет MAX(updated_at). Для больших выборок, где агрегат стоит
+как полный проход, представление передаёт готовую версию (counter_version),
+например счётчик изменений, хранящийся в родительской записи. Если версия
+совпала с If-None-Match или If-Modified-Since клиента, отдаётся пустой
+ответ 304.
+"""
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+VERSION_AGGREGATES = {"last_modified": Max("updated_at"), "count": Count("pk")}
+
+
+def _version(aggregate):
+    last_modified = aggregate["last_modified"]
+    if last_modified is None:
+        return f'"0-{aggregate["count"]}"', None
+    etag = f'"{last_modified.timestamp():.6f}-{aggregate["count"]}"'
+    return etag, int(last_modified.timestamp())
+
+
+def counter_version(prefix, counter, last_modified):
+    """Версия по счётчику изменений, без запросов к базе."""
+    etag = f'"{prefix}-{counter}"'
+    return etag, int(last_modified.timestamp()) if last_modified else None
+
+
+def queryset_version(queryset):
+    """ETag и время последнего изменения (timestamp) выборки."""
+    return _version(queryset.order_by().aggregate(**VERSION_AGGREGATES))
+
+
+async def aqueryset_version(queryset):
+    """Асинхронный вариант queryset_version."""
+    return _version(await queryset.order_by().aaggregate(**VERSION_AGGREGATES))
+
+
+def not_modified(request, etag, last_modified):
+    """Ответ 304, если данные клиента актуальны, иначе None."""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    if response.status_code not in (200, 304):
+        return response
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+async def aconditional_response(request, queryset, build_response, version=None):
+    """Условный ответ для асинхронного представления.
+
+    build_response — функция без аргументов, возвращающая корутину с ответом;
+    вызывается, только если у клиента нет актуальной версии. Если передана
+    version (etag, last_modified), агрегат по queryset не выполняется.
+    """
+    etag, last_modified = version or await aqueryset_version(queryset)
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        response = await build_response()
+    return set_validators(response, etag, last_modified)
+
+
+class ConditionalGetMixin:
+    """Поддержка условных GET в list/retrieve ViewSet-ов."""
+
+    def conditional_response(self, request, queryset, build_response):
+        etag, last_modified = queryset_version(queryset)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = build_response()
+        return set_validators(response, etag, last_modified)
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        build_response = lambda: super(ConditionalGetMixin, self).retrieve(  # noqa: E731
+            request, *args, **kwargs
+        )
+        try:
+            queryset = self.get_queryset().filter(**{self.lookup_field: kwargs[lookup]})
+        except (TypeError, ValueError):
+            # Некорректный идентификатор: обычный ответ 404 из retrieve
+            return build_response()
+        return self.conditional_response(request, queryset, build_response)
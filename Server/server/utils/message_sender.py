@@ -5,26 +5,99 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+
+class TelegramRetryAfter(Exception):
+    """Telegram ответил 429: повторить отправку не раньше чем через retry_after секунд."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Flood control, retry after {retry_after} s")
+        self.retry_after = retry_after
+
+
+class TelegramTemporaryError(Exception):
+    """Сетевая ошибка или 5xx: отправку можно повторить."""
+
+
+class TokenBucket:
+    """Асинхронный token bucket: в среднем не больше rate операций в секунду.
+
+    Пауза pause() останавливает выдачу токенов всем ожидающим — так
+    обрабатывается retry_after, который Telegram применяет ко всему боту.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        loop = asyncio.get_running_loop()
+        self._paused_until = max(self._paused_until, loop.time() + seconds)
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class TelegramSender:
     def __init__(self, bot_token):
         self.bot_token = bot_token
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
 
-    async def async_send_message(self, chat_id, text):
-        """Асинхронная функция отправки сообщения в Telegram"""
+    async def send_with_session(self, session, chat_id, text):
+        """Отправка сообщения через общую сессию aiohttp.
+
+        Returns:
+            True при успехе, False при окончательной ошибке (пользователь
+            заблокировал бота, чат не найден и т.п.).
+
+        Raises:
+            TelegramRetryAfter: превышен лимит Telegram (429).
+            TelegramTemporaryError: сетевая ошибка или ошибка сервера Telegram.
+        """
         url = f"{self.base_url}/sendMessage"
         data = {"chat_id": chat_id, "text": text}
-        
+        try:
+            async with session.post(url, json=data) as response:
+                result = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise TelegramTemporaryError(str(e)) from e
+
+        if result.get("ok"):
+            return True
+        error_code = result.get("error_code")
+        if error_code == 429:
+            retry_after = (result.get("parameters") or {}).get("retry_after", 1)
+            raise TelegramRetryAfter(retry_after)
+        if error_code is None or error_code >= 500:
+            raise TelegramTemporaryError(str(result))
+        logger.warning(f"❌ Telegram ID {chat_id}: {result.get('description')}")
+        return False
+
+    async def async_send_message(self, chat_id, text):
+        """Асинхронная функция отправки сообщения в Telegram"""
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data) as response:
-                    result = await response.json()
-                    if result.get("ok"):
-                        logger.info(f"✅ Успешно отправлено в Telegram ID {chat_id}")
-                        return True
-                    else:
-                        logger.error(f"❌ Ошибка Telegram API: {result}")
-                        return False
+                if await self.send_with_session(session, chat_id, text):
+                    logger.info(f"✅ Успешно отправлено в Telegram ID {chat_id}")
+                    return True
+                return False
         except Exception as e:
             logger.error(f"❌ Ошибка отправки в Telegram: {e}")
             return False
@@ -3,6 +3,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from order.models import Order
 import logging
 
@@ -30,12 +31,12 @@ class StripeWebhookView(APIView):
             session = event["data"]["object"]
             order_id = session["metadata"]["order_id"]
             try:
-
-                order = Order.objects.get(id=order_id)
+                # В metadata бот передаёт external_id заказа
+                order = Order.objects.get(external_id=order_id)
                 order.status = "paid"
                 order.save()
                 logger.info(f"Заказ {order_id} успешно оплачен")
-            except Order.DoesNotExist:
+            except (Order.DoesNotExist, ValidationError):
                 logger.error(f"Заказ {order_id} не найден в базе данных")
                 return Response(
                     {"error": f"Order {order_id} not found"},
@@ -7,11 +7,24 @@ load_dotenv()
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 REDIS_DSN = os.getenv("REDIS_DSN", "redis://redis:6379/0")
 
+# Режим получения обновлений: polling (по умолчанию) или webhook
+BOT_MODE = os.getenv("BOT_MODE", "polling").lower()
+WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL")
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+WEBAPP_HOST = os.getenv("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = int(os.getenv("WEBAPP_PORT", "8080"))
+# Альтернативный сервер Bot API (локальный или фейковый для тестов)
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL")
+
 # Настройки для проверки подписки
 REQUIRED_CHANNEL_ID = os.getenv("REQUIRED_CHANNEL_ID")
 REQUIRED_GROUP_ID = os.getenv("REQUIRED_GROUP_ID")
 REQUIRED_GROUP_URL = os.getenv("REQUIRED_GROUP_URL")
 REQUIRED_CHANNEL_URL = os.getenv("REQUIRED_CHANNEL_URL")
+# Время жизни кэша статусов подписки (секунды)
+SUBSCRIPTION_CACHE_TTL = int(os.getenv("SUBSCRIPTION_CACHE_TTL", "300"))
+SUBSCRIPTION_NEGATIVE_CACHE_TTL = int(os.getenv("SUBSCRIPTION_NEGATIVE_CACHE_TTL", "30"))
 
 # Настройки подключения к базе данных
 DB_HOST = os.getenv("DATABASE_HOST", "db")
@@ -26,9 +39,78 @@ DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{D
 # Платежный шлюз
 STRIPE_PUBLISHABLE_KEY = os.getenv("STRIPE_PUBLISHABLE_KEY")
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
+# stripe или fake (локальный шлюз без сети)
+PAYMENT_GATEWAY = os.getenv("PAYMENT_GATEWAY", "stripe")
+PAYMENT_TIMEOUT = float(os.getenv("PAYMENT_TIMEOUT", "10"))
+PAYMENT_MAX_RETRIES = int(os.getenv("PAYMENT_MAX_RETRIES", "2"))
+FAKE_PAYMENT_LATENCY = float(os.getenv("FAKE_PAYMENT_LATENCY", "0"))
+# Повторное оформление той же корзины переиспользует платёжную сессию.
+# Сессии Stripe по умолчанию действуют 24 часа
+CHECKOUT_SESSION_TTL = int(os.getenv("CHECKOUT_SESSION_TTL", str(23 * 3600)))
+CHECKOUT_LOCK_TTL = int(os.getenv("CHECKOUT_LOCK_TTL", "60"))
 
 # API URL
 API_URL = os.getenv("API_URL", "http://backend_api:8000")
 
+# Пул HTTP-соединений к бэкенду
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "False").lower() == "true"
+# Ответы GET с ETag для условных запросов (If-None-Match / 304)
+HTTP_ETAG_CACHE_SIZE = int(os.getenv("HTTP_ETAG_CACHE_SIZE", "1000"))
+HTTP_ETAG_CACHE_TTL = float(os.getenv("HTTP_ETAG_CACHE_TTL", str(24 * 3600)))
+
+# Общий пул соединений Redis процесса бота
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+# Период записи загрузки пула Redis в лог, секунды
+REDIS_STATS_INTERVAL = float(os.getenv("REDIS_STATS_INTERVAL", "60"))
+
+# Кэш каталога (LRU процесса + общий Redis)
+CATALOG_CACHE_MAX_SIZE = int(os.getenv("CATALOG_CACHE_MAX_SIZE", "1000"))
+CATALOG_CACHE_LOCAL_TTL = float(os.getenv("CATALOG_CACHE_LOCAL_TTL", "60"))
+CATALOG_CACHE_REDIS_TTL = int(os.getenv("CATALOG_CACHE_REDIS_TTL", "600"))
+
+# Срок хранения file_id фотографий товаров в Redis
+PHOTO_FILE_ID_TTL = int(os.getenv("PHOTO_FILE_ID_TTL", str(30 * 24 * 3600)))
+
+# Пакетная регистрация пользователей в бэкенде
+REGISTRATION_BATCH_SIZE = int(os.getenv("REGISTRATION_BATCH_SIZE", "100"))
+REGISTRATION_FLUSH_INTERVAL = float(os.getenv("REGISTRATION_FLUSH_INTERVAL", "2"))
+
+# Фоновая предзагрузка фотографий каталога в служебный чат
+IMAGE_STORAGE_CHAT_ID = os.getenv("IMAGE_STORAGE_CHAT_ID")
+IMAGE_WARMUP_CONCURRENCY = int(os.getenv("IMAGE_WARMUP_CONCURRENCY", "3"))
+IMAGE_WARMUP_SEND_INTERVAL = float(os.getenv("IMAGE_WARMUP_SEND_INTERVAL", "3"))
+IMAGE_WARMUP_INTERVAL = float(os.getenv("IMAGE_WARMUP_INTERVAL", "3600"))
+
+# Журнал заказов и Excel-отчёт, который строится из него в фоне
+ORDER_JOURNAL_PATH = os.getenv("ORDER_JOURNAL_PATH", "reports/orders.db")
+ORDER_REPORT_PATH = os.getenv("ORDER_REPORT_PATH", "reports/orders.xlsx")
+ORDER_EXPORT_INTERVAL = float(os.getenv("ORDER_EXPORT_INTERVAL", "60"))
+ORDER_EXPORT_BATCH_SIZE = int(os.getenv("ORDER_EXPORT_BATCH_SIZE", "500"))
+
+# Очередь отправки заказов в Order API бэкенда
+ORDER_OUTBOX_BATCH_SIZE = int(os.getenv("ORDER_OUTBOX_BATCH_SIZE", "50"))
+ORDER_OUTBOX_INTERVAL = float(os.getenv("ORDER_OUTBOX_INTERVAL", "1"))
+ORDER_OUTBOX_MAX_BACKOFF = float(os.getenv("ORDER_OUTBOX_MAX_BACKOFF", "60"))
+
+# Кэш FAQ: после FAQ_CACHE_TTL обновляется в фоне, пока отдаются старые данные.
+# Изменения в админке приходят сразу через pub/sub
+FAQ_CACHE_TTL = float(os.getenv("FAQ_CACHE_TTL", "300"))
+FAQ_INVALIDATION_CHANNEL = os.getenv("FAQ_INVALIDATION_CHANNEL", "faq:invalidate")
+# Сколько Telegram кэширует ответы inline-поиска FAQ на своей стороне
+FAQ_INLINE_CACHE_TIME = int(os.getenv("FAQ_INLINE_CACHE_TIME", "300"))
+
+# Inline-поиск товаров: запрос вида "<префикс> <текст>" в любом чате
+PRODUCT_SEARCH_PREFIX = os.getenv("PRODUCT_SEARCH_PREFIX", "товар")
+PRODUCT_SEARCH_PAGE_SIZE = int(os.getenv("PRODUCT_SEARCH_PAGE_SIZE", "20"))
+PRODUCT_SEARCH_CACHE_TIME = int(os.getenv("PRODUCT_SEARCH_CACHE_TIME", "60"))
+
 # Настройки платежных систем
 PAYMENT_TOKEN = os.getenv("PAYMENT_TOKEN")
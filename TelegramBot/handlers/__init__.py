@@ -2,9 +2,11 @@ from . import start
 from . import catalog
 from . import faq
 from . import cart
+from utils import subscription_check
 
 def setup_handlers(dp):
     start.register_handlers(dp)
     catalog.register_handlers(dp)
     faq.register_handlers(dp)
-    cart.register_handlers(dp)
\ No newline at end of file
+    cart.register_handlers(dp)
+    subscription_check.register_handlers(dp)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import uuid
 from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -6,11 +5,15 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.filters import Command, StateFilter
 import logging
-from typing import Dict, Any
-from services.cart_service import CartService
-from services.payment_service import PaymentService
-from repositories.order_repository import OrderExcelRepository
-from config import REDIS_DSN
+import re
+from typing import Dict, Any, Optional
+from redis.exceptions import RedisError
+from models.cart import Cart
+from services.cart_service import cart_service
+from services.order_outbox import order_outbox
+from services.checkout_service import checkout_service
+from repositories.order_repository import OrderJournalRepository
+from config import ORDER_JOURNAL_PATH
 
 router = Router()
 logger = logging.getLogger(__name__)
@@ -22,6 +25,13 @@ CHECKOUT_CALLBACK = "checkout"
 EMPTY_CART_MESSAGE = "🛒 Ваша корзина пуста"
 BACK_TO_CATALOG_TEXT = "◀️ Назад к каталогу"
 CATALOG_CALLBACK = "catalog"
+# Ограничения полей заказа на сервере (Order.name, Order.phone): заказ с более
+# длинными значениями не проходит валидацию и уходит в список отклонённых
+NAME_MAX_LENGTH = 255
+PHONE_MAX_LENGTH = 20
+# E.164: не больше 15 цифр; меньше 5 — заведомо не телефон
+PHONE_DIGITS_RANGE = (5, 15)
+PHONE_ALLOWED_RE = re.compile(r"[\d\s()+\-.]+")
 
 
 class CartStates(StatesGroup):
@@ -33,9 +43,7 @@ class CartStates(StatesGroup):
 
 
 # Инициализация зависимостей
-cart_service = CartService(REDIS_DSN)
-payment_service = PaymentService()
-order_repository = OrderExcelRepository("orders.xlsx")
+order_repository = OrderJournalRepository(ORDER_JOURNAL_PATH)
 
 
 @router.message(Command("cart"))
@@ -61,15 +69,19 @@ async def show_cart_callback(callback: CallbackQuery, state: FSMContext) -> None
     await callback.answer()
 
 
-async def _show_cart(message: Message, state: FSMContext, user_id: int) -> None:
+async def _show_cart(
+    message: Message, state: FSMContext, user_id: int, cart: Optional[Cart] = None
+) -> None:
     """Внутренняя функция для отображения содержимого корзины.
 
     Args:
         message: Сообщение для ответа пользователю.
         state: Контекст FSM для управления состояниями.
         user_id: Идентификатор пользователя.
+        cart: Уже полученная корзина (например, результат изменения).
     """
-    cart = await cart_service.get_cart(user_id)
+    if cart is None:
+        cart = await cart_service.get_cart(user_id)
     if cart.is_empty():
         kb = InlineKeyboardBuilder()
         kb.button(text="📋 Каталог", callback_data=CATALOG_CALLBACK)
@@ -82,7 +94,7 @@ async def _show_cart(message: Message, state: FSMContext, user_id: int) -> None:
     for item in cart.items:
         response += (
             f"{item.product.name} x{item.quantity} - "
-            f"{item.product.price * item.quantity:.2f} ₽\n"
+            f"{item.price * item.quantity:.2f} ₽\n"
         )
         kb.button(
             text=f"Удалить {item.product.name}",
@@ -113,11 +125,9 @@ async def remove_from_cart(callback: CallbackQuery, state: FSMContext) -> None:
         return
 
     user_id = callback.from_user.id
-    cart = await cart_service.get_cart(user_id)
-    cart.remove_item(product_id)
-    await cart_service.save_cart(user_id, cart)
+    cart = await cart_service.remove_item(user_id, product_id)
     await callback.answer("Товар удалён из корзины")
-    await _show_cart(callback.message, state, user_id)
+    await _show_cart(callback.message, state, user_id, cart)
 
 
 @router.callback_query(F.data == CHECKOUT_CALLBACK)
@@ -147,6 +157,9 @@ async def process_name(message: Message, state: FSMContext) -> None:
         message: Входящее сообщение с именем.
         state: Контекст FSM для управления состояниями.
     """
+    if len(message.text) > NAME_MAX_LENGTH:
+        await message.answer(f"Имя слишком длинное (до {NAME_MAX_LENGTH} символов). Введите ваше имя:")
+        return
     await state.update_data(name=message.text)
     await state.set_state(CartStates.waiting_for_address)
     await message.answer("Введите ваш адрес:")
@@ -168,29 +181,51 @@ async def process_address(message: Message, state: FSMContext) -> None:
 @router.message(StateFilter(CartStates.waiting_for_phone), F.text)
 async def process_phone(message: Message, state: FSMContext) -> None:
     """Обработка ввода телефона и завершение оформления заказа."""
+    phone = _normalize_phone(message.text)
+    if phone is None:
+        await message.answer("Не удалось распознать номер. Введите телефон, например +7 999 123-45-67:")
+        return
     user_id = message.from_user.id
     data = await state.get_data()
     cart = await cart_service.get_cart(user_id)
+    if cart.is_empty():
+        await message.answer("Ваша корзина пуста.", reply_markup=_back_to_catalog_kb())
+        await state.clear()
+        return
     total = cart.get_total()
+
+    processing_msg = await message.answer("⏳ Подождите, заказ формируется...")
+
+    # Повтор с той же корзиной возвращает уже созданный заказ и ссылку
+    payment = await checkout_service.checkout(user_id, cart)
+    if 'error' in payment:
+        await processing_msg.edit_text(f"Ошибка: {payment['error']}")
+        return
+
+    # Заказ ставится в очередь и при повторе: external_id в Order API и
+    # order_id в журнале не дают дублей, а повтор после сбоя очереди
+    # доставляет заказ, оформленный с той же сессией оплаты
     order = {
-        "id": str(uuid.uuid4()),
+        "id": payment["order_id"],
         "user_id": user_id,
         "items": cart.items[:],
         "total": total,
         "name": data["name"],
         "address": data["address"],
-        "phone": message.text,
+        "phone": phone,
         "status": "pending",
     }
-
-    processing_msg = await message.answer("⏳ Подождите, заказ формируется...")
-
-    payment = await payment_service.create_payment(total, order["id"])
-    if 'error' in payment:
-        await processing_msg.edit_text(f"Ошибка: {payment['error']}")
+    try:
+        await order_outbox.enqueue(order)
+    except RedisError as e:
+        # Без очереди бэкенд не узнает о заказе: ссылку на оплату не выдаём,
+        # корзина сохраняется, повторный ввод телефона повторит отправку
+        logger.error(f"Не удалось поставить заказ {order['id']} в очередь: {e}")
+        await processing_msg.edit_text(
+            "Не удалось оформить заказ. Попробуйте ещё раз — введите ваш телефон:"
+        )
         return
-
-    order_repository.save_order(order)
+    await order_repository.save_order(order)
     kb = InlineKeyboardBuilder()
     kb.button(text="Оплатить", url=payment['confirmation_url'])
     kb.button(text=BACK_TO_CATALOG_TEXT, callback_data=CATALOG_CALLBACK)
@@ -199,9 +234,31 @@ async def process_phone(message: Message, state: FSMContext) -> None:
         reply_markup=kb.as_markup(),
     )
     await cart_service.clear_cart(user_id)
+    await checkout_service.complete(user_id, cart)
     await state.clear()
 
 
+def _normalize_phone(text: str) -> Optional[str]:
+    """Приведение телефона к виду +79991234567 (цифры и ведущий +).
+
+    Args:
+        text: Телефон в свободной форме.
+
+    Returns:
+        Optional[str]: Нормализованный номер не длиннее PHONE_MAX_LENGTH
+        или None, если ввод не похож на телефон.
+    """
+    text = text.strip()
+    if not PHONE_ALLOWED_RE.fullmatch(text):
+        return None
+    digits = re.sub(r"\D", "", text)
+    low, high = PHONE_DIGITS_RANGE
+    if not low <= len(digits) <= high:
+        return None
+    phone = f"+{digits}" if text.startswith("+") else digits
+    return phone[:PHONE_MAX_LENGTH]
+
+
 def _back_to_catalog_kb() -> InlineKeyboardBuilder:
     """Создание клавиатуры для возврата в каталог.
 
@@ -1,21 +1,33 @@
+import html
 import uuid
-from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery, BufferedInputFile
+from aiogram import Router, F, Bot
+from aiogram.types import (
+    CallbackQuery,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InlineQuery,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+    Message,
+)
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.filters import Command
 import logging
-import httpx
 from services.api_provider import api_provider as api
-from services.cart_service import CartService
-from config import REDIS_DSN
+from services.cart_service import cart_service
+from services.photo_service import photo_service
+from models.catalog import Product
+from config import (
+    PRODUCT_SEARCH_CACHE_TIME,
+    PRODUCT_SEARCH_PAGE_SIZE,
+    PRODUCT_SEARCH_PREFIX,
+)
 
 router = Router()
 logger = logging.getLogger(__name__)
 
-# Инициализация сервиса корзины
-cart_service = CartService(REDIS_DSN)
 
 class CatalogStates(StatesGroup):
     """Состояния FSM для управления каталогом."""
@@ -49,6 +61,7 @@ async def catalog_command(message: Message, state: FSMContext) -> None:
     kb = InlineKeyboardBuilder()
     for category in categories:
         kb.button(text=category.name, callback_data=f"{CATEGORY_PREFIX}{category.id}")
+    kb.button(text="🔍 Поиск", switch_inline_query_current_chat=f"{PRODUCT_SEARCH_PREFIX} ")
     kb.button(text="🛒 Корзина", callback_data="cart")
     kb.button(text="◀️ Назад", callback_data=BACK_TO_MAIN)
     kb.adjust(2)
@@ -67,6 +80,7 @@ async def show_categories(callback: CallbackQuery, state: FSMContext) -> None:
     kb = InlineKeyboardBuilder()
     for category in categories:
         kb.button(text=category.name, callback_data=f"{CATEGORY_PREFIX}{category.id}")
+    kb.button(text="🔍 Поиск", switch_inline_query_current_chat=f"{PRODUCT_SEARCH_PREFIX} ")
     kb.button(text="🛒 Корзина", callback_data="cart")
     kb.button(text="◀️ Назад", callback_data=BACK_TO_MAIN)
     kb.adjust(2)
@@ -211,9 +225,7 @@ async def add_to_cart(callback: CallbackQuery, state: FSMContext) -> None:
     if not product:
         await callback.answer("Товар не найден", show_alert=True)
         return
-    cart = await cart_service.get_cart(user_id)
-    cart.add_item(product, quantity)
-    await cart_service.save_cart(user_id, cart)
+    await cart_service.add_item(user_id, product, quantity)
     await callback.answer("Товар добавлен в корзину!", show_alert=True)
     await state.update_data(product_id=product_id)
     await show_product_details(callback, state)
@@ -240,38 +252,104 @@ async def show_product_details(callback: CallbackQuery, state: FSMContext) -> No
     if not product:
         await callback.answer("Товар не найден")
         return
+    await callback.message.delete()
+    await send_product_card(callback.message, state, product)
+    await callback.answer()
+
+def _product_caption(product: Product) -> str:
+    return (
+        f"📦 <b>{html.escape(product.name)}</b>\n\n{html.escape(product.description)}"
+        f"\n\n💰 Цена: {product.price} ₽"
+    )
+
+async def send_product_card(message: Message, state: FSMContext, product: Product) -> None:
+    """Отправка карточки товара в чат сообщения.
+
+    Используется при выборе товара в каталоге и при переходе по ссылке
+    /start product_<id> из результатов inline-поиска.
+
+    Args:
+        message: Сообщение, в чат которого отправляется карточка.
+        state: Контекст FSM для управления состояниями.
+        product: Товар.
+    """
     kb = InlineKeyboardBuilder()
     kb.button(text="🛒 Добавить в корзину", callback_data=f"{ADD_TO_CART}{product.id}")
     kb.button(text="◀️ Назад к списку товаров", callback_data=f"{SUBCATEGORY_PREFIX}{product.subcategory_id}")
     kb.adjust(1)
-    image_url = product.image_url
-    logger.info(f"Загрузка изображения с URL: {image_url}")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(image_url)
-            response.raise_for_status()
-            image_data = response.content
-        except httpx.HTTPError as e:
-            logger.error(f"Ошибка загрузки изображения: {e}")
-            image_data = None
-    await state.update_data(product_id=product_id)
+    await state.update_data(product_id=product.id)
     await state.set_state(CatalogStates.viewing_product)
-    await callback.message.delete()
-    if image_data:
-        photo = BufferedInputFile(file=image_data, filename="product_image.png")
-        await callback.message.answer_photo(
-            photo=photo,
-            caption=f"📦 <b>{product.name}</b>\n\n{product.description}\n\n💰 Цена: {product.price} ₽",
+    caption = _product_caption(product)
+    sent = await photo_service.send_photo(message, product, caption, kb.as_markup())
+    if not sent:
+        await message.answer(
+            text=f"{caption}\n\n(Изображение недоступно)",
             reply_markup=kb.as_markup(),
             parse_mode="HTML",
         )
-    else:
-        await callback.message.answer(
-            text=f"📦 <b>{product.name}</b>\n\n{product.description}\n\n💰 Цена: {product.price} ₽\n\n(Изображение недоступно)",
-            reply_markup=kb.as_markup(),
-            parse_mode="HTML",
+
+def _product_search_query(inline_query: InlineQuery):
+    """Фильтр inline-запросов вида "<префикс> <текст>".
+
+    Остальные inline-запросы уходят в поиск FAQ. Текст запроса без префикса
+    передаётся в обработчик аргументом search_text.
+    """
+    parts = inline_query.query.split(maxsplit=1)
+    if not parts or parts[0].lower() != PRODUCT_SEARCH_PREFIX:
+        return False
+    return {"search_text": parts[1].strip() if len(parts) > 1 else ""}
+
+@router.inline_query(_product_search_query)
+async def inline_product_search(inline_query: InlineQuery, bot: Bot, search_text: str) -> None:
+    """Inline-поиск товаров через полнотекстовый поиск бэкенда.
+
+    Каждый результат содержит ссылку /start product_<id>, которая открывает
+    карточку товара в боте без прохода по категориям и подкатегориям.
+    Следующие страницы запрашиваются по offset.
+
+    Args:
+        inline_query: Inline-запрос пользователя.
+        bot: Экземпляр бота.
+        search_text: Текст запроса без префикса.
+    """
+    if not search_text:
+        await inline_query.answer(results=[], cache_time=1)
+        return
+    try:
+        page = int(inline_query.offset or 1)
+    except ValueError:
+        page = 1
+    data = await api.catalog.search_products(
+        search_text, page=page, limit=PRODUCT_SEARCH_PAGE_SIZE
+    )
+    bot_username = (await bot.me()).username
+    results = [
+        InlineQueryResultArticle(
+            id=str(product.id),
+            title=product.name,
+            description=f"{product.price} ₽ · {product.description[:80]}",
+            input_message_content=InputTextMessageContent(
+                message_text=_product_caption(product), parse_mode="HTML"
+            ),
+            reply_markup=InlineKeyboardMarkup(
+                inline_keyboard=[
+                    [
+                        InlineKeyboardButton(
+                            text="🛒 Открыть в боте",
+                            url=f"https://t.me/{bot_username}?start={PRODUCT_PREFIX}{product.id}",
+                        )
+                    ]
+                ]
+            ),
         )
-    await callback.answer()
+        for product in data["products"]
+    ]
+    await inline_query.answer(
+        results=results,
+        cache_time=PRODUCT_SEARCH_CACHE_TIME,
+        is_personal=False,
+        next_offset=str(page + 1) if data["has_next"] else "",
+    )
 
 @router.callback_query(F.data == BACK_TO_CATEGORIES)
 async def back_to_categories(callback: CallbackQuery, state: FSMContext) -> None:
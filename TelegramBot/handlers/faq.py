@@ -11,28 +11,16 @@ from aiogram.types import (
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.filters import Command
 import logging
-from services.api_provider import api_provider as api
-from typing import List
+from services.faq_cache import faq_cache
+from config import FAQ_INLINE_CACHE_TIME
 
 router = Router()
 logger = logging.getLogger(__name__)
 
-faq_cache: List["FAQ"] = []
-
-
-async def load_faq_cache():
-    """Загружаем FAQ из API в кэш при необходимости"""
-    global faq_cache
-    if not faq_cache:
-        faq_list = await api.faq.get_faq()
-        faq_cache = faq_list
-    return faq_cache
-
-
 @router.message(Command("faq"))
 async def faq_command(message: Message):
     """Обработчик команды /faq"""
-    faq_list = await load_faq_cache()
+    faq_list = await faq_cache.get_all()
     if not faq_list:
         await message.answer("Список FAQ пуст или недоступен.")
         return
@@ -51,7 +39,7 @@ async def faq_command(message: Message):
 @router.callback_query(F.data == "faq")
 async def faq_handler(callback: CallbackQuery):
     """Обработчик кнопки FAQ"""
-    faq_list = await load_faq_cache()
+    faq_list = await faq_cache.get_all()
     if not faq_list:
         await callback.message.edit_text("Список FAQ пуст или недоступен.")
         await callback.answer()
@@ -75,8 +63,7 @@ async def faq_detail_handler(callback: CallbackQuery):
     logger.info(f"Запуск faq_detail_handler с callback_data: {callback.data}")
 
     faq_id = int(callback.data.split("_")[1])
-    faq_list = await load_faq_cache()
-    faq = next((item for item in faq_list if item.id == faq_id), None)
+    faq = await faq_cache.get(faq_id)
 
     if not faq:
         await callback.message.edit_text("Вопрос не найден.")
@@ -105,7 +92,7 @@ async def faq_detail_handler(callback: CallbackQuery):
 async def inline_faq_search(inline_query: InlineQuery):
     """Обработчик inline-поиска FAQ"""
     query = inline_query.query.strip().lower()
-    faq_list = await load_faq_cache()
+    faq_list = await faq_cache.get_all()
 
     if not faq_list:
         await inline_query.answer(
@@ -116,29 +103,29 @@ async def inline_faq_search(inline_query: InlineQuery):
         )
         return
 
-    # Фильтруем FAQ по запросу
-    results = []
-    for faq in faq_list:
-        if query in faq.question.lower() or not query:
-            results.append(
-                InlineQueryResultArticle(
-                    id=str(faq.id),
-                    title=faq.question,
-                    input_message_content=InputTextMessageContent(
-                        message_text=f"❓ **Вопрос**: {faq.question}\n\n📝 **Ответ**: {faq.answer}",
-                        parse_mode="Markdown",
-                    ),
-                    description=(
-                        faq.answer[:100] + "..."
-                        if len(faq.answer) > 100
-                        else faq.answer
-                    ),
-                )
-            )
+    # Без запроса — весь список, иначе — поиск по индексу с ранжированием
+    found = await faq_cache.search(query, limit=50) if query else faq_list[:50]
+    results = [
+        InlineQueryResultArticle(
+            id=str(faq.id),
+            title=faq.question,
+            input_message_content=InputTextMessageContent(
+                message_text=f"❓ **Вопрос**: {faq.question}\n\n📝 **Ответ**: {faq.answer}",
+                parse_mode="Markdown",
+            ),
+            description=(
+                faq.answer[:100] + "..."
+                if len(faq.answer) > 100
+                else faq.answer
+            ),
+        )
+        for faq in found
+    ]
 
     await inline_query.answer(
-        results=results[:50],  # Telegram ограничивает до 50 результатов
-        cache_time=1,
+        results=results,  # Telegram ограничивает до 50 результатов
+        cache_time=FAQ_INLINE_CACHE_TIME,
+        is_personal=False,
         switch_pm_text="Список FAQ",
         switch_pm_parameter="faq",
     )
@@ -1,20 +1,21 @@
 from aiogram import Router, F, Bot
 from aiogram.types import Message, CallbackQuery
-from aiogram.filters import Command, CommandStart
+from aiogram.filters import CommandStart
+from aiogram.fsm.context import FSMContext
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 import logging
-import aiohttp
+from handlers.catalog import PRODUCT_PREFIX, send_product_card
+from services.api_provider import api_provider as api
+from services.registration_service import registration_service
 from utils.subscription_check import check_subscription
 from config import REQUIRED_GROUP_URL, REQUIRED_CHANNEL_URL
 
 router = Router()
 logger = logging.getLogger(__name__)
 
-API_URL = "http://backend_api:8000/api/users/register/"
-
 
 @router.message(CommandStart())
-async def start_handler(message: Message, bot: Bot):
+async def start_handler(message: Message, bot: Bot, state: FSMContext):
     """Обработчик команды /start, включая возвращение после оплаты."""
     telegram_id = message.from_user.id
     args = message.text.split()
@@ -56,10 +57,20 @@ async def start_handler(message: Message, bot: Bot):
         )
         return
 
-    # Проверяем регистрацию перед показом меню
-    is_registered = await check_registration(telegram_id)
-    if not is_registered:
-        await register_user(telegram_id)
+    # Регистрация в бэкенде выполняется в фоне
+    await registration_service.ensure_registered(telegram_id)
+
+    # Ссылка на товар из inline-поиска: сразу открываем карточку
+    if len(args) > 1 and args[1].startswith(PRODUCT_PREFIX):
+        try:
+            product_id = int(args[1][len(PRODUCT_PREFIX):])
+        except ValueError:
+            product_id = None
+        product = await api.catalog.get_product(product_id) if product_id else None
+        if product:
+            await send_product_card(message, state, product)
+            return
+        await message.answer("Товар не найден")
 
     kb = InlineKeyboardBuilder()
     kb.button(text="📋 Каталог", callback_data="catalog")
@@ -76,17 +87,16 @@ async def start_handler(message: Message, bot: Bot):
 @router.callback_query(F.data == "check_subscription")
 async def check_subscription_callback(callback: CallbackQuery, bot: Bot):
     telegram_id = callback.from_user.id
-    is_subscribed = await check_subscription(bot, telegram_id)
+    # Пользователь только что подписался: отрицательный результат из кэша устарел
+    is_subscribed = await check_subscription(bot, telegram_id, force=True)
     if not is_subscribed:
         await callback.answer(
             "Вы всё ещё не подписаны на все необходимые каналы", show_alert=True
         )
         return
 
-    # Проверяем регистрацию перед показом меню
-    is_registered = await check_registration(telegram_id)
-    if not is_registered:
-        await register_user(telegram_id)
+    # Регистрация в бэкенде выполняется в фоне
+    await registration_service.ensure_registered(telegram_id)
 
     kb = InlineKeyboardBuilder()
     kb.button(text="📋 Каталог", callback_data="catalog")
@@ -101,37 +111,5 @@ async def check_subscription_callback(callback: CallbackQuery, bot: Bot):
     await callback.answer()
 
 
-async def register_user(telegram_id: int):
-    """Регистрация пользователя в Django API"""
-    async with aiohttp.ClientSession() as session:
-        payload = {"telegram_id": str(telegram_id)}
-        try:
-            async with session.post(API_URL, json=payload) as response:
-                if response.status in (200, 201):
-                    logger.info(
-                        f"Пользователь {telegram_id} успешно зарегистрирован или уже существует"
-                    )
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Ошибка регистрации {telegram_id}: {error_text}")
-        except Exception as e:
-            logger.error(f"Исключение при регистрации {telegram_id}: {e}")
-
-
-async def check_registration(telegram_id: int) -> bool:
-    """Проверка, зарегистрирован ли пользователь"""
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(
-                API_URL, json={"telegram_id": str(telegram_id)}
-            ) as response:
-                return (
-                    response.status == 200
-                )  # 200 означает, что пользователь уже существует
-        except Exception as e:
-            logger.error(f"Ошибка проверки регистрации {telegram_id}: {e}")
-            return False
-
-
 def register_handlers(dp):
     dp.include_router(router)
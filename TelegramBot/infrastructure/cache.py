@@ -0,0 +1,145 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Ограниченный по размеру in-process кэш с вытеснением LRU и TTL записей."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Инициализация кэша.
+
+        Args:
+            max_size: Максимальное количество записей.
+            ttl: Время жизни записи в секундах.
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TwoTierCache:
+    """Двухуровневый кэш: локальный LRU процесса поверх общего Redis.
+
+    Значения хранятся в Redis в виде JSON, поэтому кэшировать можно только
+    сериализуемые данные (словари, списки, числа, строки).
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        namespace: str,
+        max_size: int,
+        local_ttl: float,
+        redis_ttl: int,
+    ) -> None:
+        """Инициализация кэша.
+
+        Args:
+            redis: Клиент Redis для общего уровня.
+            namespace: Префикс ключей в Redis.
+            max_size: Размер локального LRU.
+            local_ttl: Время жизни записи в локальном уровне, секунды.
+            redis_ttl: Время жизни записи в Redis, секунды.
+        """
+        self._redis = redis
+        self._namespace = namespace
+        self._local = LRUCache(max_size, local_ttl)
+        self._redis_ttl = redis_ttl
+        self.hits_local = 0
+        self.hits_redis = 0
+        self.misses = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Получение значения: сначала из памяти процесса, затем из Redis."""
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits_local += 1
+            return value
+        try:
+            raw = await self._redis.get(self._redis_key(key))
+        except RedisError as e:
+            logger.warning(f"Redis недоступен для кэша {self._namespace}: {e}")
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        value = json.loads(raw)
+        self._local.set(key, value)
+        self.hits_redis += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Запись значения в оба уровня кэша."""
+        self._local.set(key, value)
+        try:
+            await self._redis.set(
+                self._redis_key(key), json.dumps(value), ex=self._redis_ttl
+            )
+        except RedisError as e:
+            logger.warning(f"Не удалось записать {key} в Redis: {e}")
+
+    async def invalidate(self, key: Optional[str] = None) -> None:
+        """Инвалидация одного ключа или всего пространства имён.
+
+        Локальные уровни других процессов истекут по своему TTL.
+        """
+        try:
+            if key is not None:
+                self._local.delete(key)
+                await self._redis.delete(self._redis_key(key))
+                return
+            self._local.clear()
+            keys = [k async for k in self._redis.scan_iter(f"{self._namespace}:*")]
+            if keys:
+                await self._redis.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Не удалось инвалидировать кэш {self._namespace}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики попаданий и промахов."""
+        return {
+            "hits_local": self.hits_local,
+            "hits_redis": self.hits_redis,
+            "misses": self.misses,
+            "local_size": len(self._local),
+        }
@@ -0,0 +1,123 @@
+"""Локальная замена Bot API Telegram для тестов и нагрузочных прогонов.
+
+Сервер отвечает на вызовы методов бота правдоподобными ответами и умеет
+отправлять обновления на вебхук бота с секретным заголовком.
+
+Запуск:
+    python -m infrastructure.fake_telegram --port 8081 \\
+        --webhook http://localhost:8080/webhook --secret <WEBHOOK_SECRET>
+
+Бот направляется на сервер переменной TELEGRAM_API_URL=http://localhost:8081.
+"""
+import argparse
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class FakeTelegramServer:
+    """Минимальный Bot API: фиксирует вызовы и возвращает успешные ответы."""
+
+    def __init__(
+        self, webhook_url: Optional[str] = None, secret_token: Optional[str] = None
+    ) -> None:
+        self.webhook_url = webhook_url
+        self.secret_token = secret_token
+        self.calls: List[Dict[str, Any]] = []
+        self._message_ids = itertools.count(1)
+        self._update_ids = itertools.count(1)
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self.handle_method)
+        app.router.add_post("/updates", self.handle_push_update)
+        return app
+
+    async def handle_method(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        if request.content_type == "application/json":
+            params = await request.json()
+        else:
+            params = {k: v for k, v in (await request.post()).items()}
+        self.calls.append({"method": method, "params": params})
+        result = self._result(method.lower(), params)
+        return web.json_response({"ok": True, "result": result})
+
+    def _message(self, params: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        chat_id = params.get("chat_id", 0)
+        try:
+            chat_id = int(chat_id)
+        except (TypeError, ValueError):
+            pass
+        return {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            **extra,
+        }
+
+    def _result(self, method: str, params: Dict[str, Any]) -> Any:
+        if method == "getme":
+            return {"id": 1, "is_bot": True, "first_name": "FakeBot", "username": "fake_bot"}
+        if method == "sendmessage":
+            return self._message(params, text=params.get("text", ""))
+        if method == "sendphoto":
+            message_id = next(self._message_ids)
+            return self._message(
+                params,
+                photo=[
+                    {
+                        "file_id": f"fake-photo-{message_id}",
+                        "file_unique_id": f"fake-unique-{message_id}",
+                        "width": 1280,
+                        "height": 1280,
+                    }
+                ],
+            )
+        if method == "getchatmember":
+            return {
+                "status": "member",
+                "user": {"id": int(params.get("user_id", 0)), "is_bot": False, "first_name": "User"},
+            }
+        if method == "getwebhookinfo":
+            return {"url": self.webhook_url or "", "has_custom_certificate": False, "pending_update_count": 0}
+        if method == "setwebhook":
+            self.webhook_url = params.get("url", self.webhook_url)
+            self.secret_token = params.get("secret_token", self.secret_token)
+        return True
+
+    async def push_update(self, update: Dict[str, Any]) -> int:
+        """Отправка обновления на вебхук бота; возвращает HTTP-статус."""
+        update = {"update_id": next(self._update_ids), **update}
+        headers = {SECRET_HEADER: self.secret_token} if self.secret_token else {}
+        async with aiohttp.ClientSession() as session:
+            async with session.post(self.webhook_url, json=update, headers=headers) as response:
+                return response.status
+
+    async def handle_push_update(self, request: web.Request) -> web.Response:
+        """POST /updates с телом обновления пересылает его на вебхук бота."""
+        status = await self.push_update(await request.json())
+        return web.json_response({"webhook_status": status})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Локальный фейковый Bot API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--webhook", default=None, help="URL вебхука бота")
+    parser.add_argument("--secret", default=None, help="Секрет вебхука")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    server = FakeTelegramServer(args.webhook, args.secret)
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,19 @@
 import httpx
 import logging
 from typing import Dict, Any, Optional
-from config import API_URL
+from urllib.parse import urlencode
+from config import (
+    API_URL,
+    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED,
+    HTTP_ETAG_CACHE_SIZE,
+    HTTP_ETAG_CACHE_TTL,
+)
+from infrastructure.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,26 +25,100 @@ class BackendUnavailableError(Exception):
 
 
 class HttpClient:
+    """HTTP-клиент бэкенда с одним долгоживущим пулом соединений на процесс.
+
+    Ответы GET с заголовком ETag запоминаются вместе с телом; повторный запрос
+    отправляется с If-None-Match, и при ответе 304 возвращается сохранённое
+    тело без повторной передачи и разбора данных.
+    """
+
     def __init__(self, base_url: str = API_URL):
         self.base_url = base_url
         self.headers = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._validators = LRUCache(HTTP_ETAG_CACHE_SIZE, HTTP_ETAG_CACHE_TTL)
+        self.not_modified = 0
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_ENABLED,
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    async def start(self) -> None:
+        """Создание пула соединений (вызывается при старте бота)."""
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = self._build_client()
+        logger.info(
+            f"HTTP-клиент запущен: {self.base_url}, http2={HTTP2_ENABLED}, "
+            f"max_connections={HTTP_POOL_MAX_CONNECTIONS}"
+        )
+
+    async def close(self) -> None:
+        """Закрытие пула соединений (вызывается при остановке бота)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP-клиент остановлен")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            # Ленивое создание на случай вызова до on_startup (скрипты, тесты)
+            self._client = self._build_client()
+        return self._client
+
+    @staticmethod
+    def _validator_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
 
     async def request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        url = f"{self.base_url}{endpoint}"
         kwargs["headers"] = {**self.headers, **kwargs.get("headers", {})}
+        is_get = method.upper() == "GET"
+        key = self._validator_key(endpoint, kwargs.get("params")) if is_get else None
+        cached = self._validators.get(key) if is_get else None
+        if cached is not None:
+            kwargs["headers"]["If-None-Match"] = cached[0]
+        try:
+            logger.info(f"Отправка {method} запроса на {self.base_url}{endpoint}")
+            response = await self.client.request(method.upper(), endpoint, **kwargs)
+            if response.status_code == 304 and cached is not None:
+                self.not_modified += 1
+                return cached[1]
+            response.raise_for_status()
+            data = response.json()
+            etag = response.headers.get("ETag")
+            if is_get and etag:
+                self._validators.set(key, (etag, data))
+            return data
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ошибка HTTP: {e} - Ответ: {e.response.text}")
+            raise
+        except (httpx.RequestError, OSError) as e:
+            logger.error(f"Сетевая ошибка при запросе {endpoint}: {e}")
+            raise BackendUnavailableError("Бэкенд временно недоступен")
+        except Exception as e:
+            logger.error(f"Неизвестная ошибка при запросе {endpoint}: {e}")
+            raise
 
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info(f"Отправка {method} запроса на {url}")
-                response = await getattr(client, method.lower())(url, **kwargs)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Ошибка HTTP: {e} - Ответ: {e.response.text}")
-                raise
-            except (httpx.RequestError, OSError) as e:
-                logger.error(f"Сетевая ошибка при запросе {url}: {e}")
-                raise BackendUnavailableError("Бэкенд временно недоступен")
-            except Exception as e:
-                logger.error(f"Неизвестная ошибка при запросе {url}: {e}")
-                raise
+    async def download(self, url: str) -> bytes:
+        """Скачивание бинарного содержимого (например, изображения) через общий пул."""
+        try:
+            response = await self.client.get(url)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Ошибка HTTP при загрузке {url}: {e}")
+            raise
+        except (httpx.RequestError, OSError) as e:
+            logger.error(f"Сетевая ошибка при загрузке {url}: {e}")
+            raise BackendUnavailableError("Бэкенд временно недоступен")
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+from aiogram.fsm.storage.redis import RedisStorage
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+from config import (
+    REDIS_DSN,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_HEALTH_CHECK_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CountingConnectionPool(BlockingConnectionPool):
+    """Пул, считающий выданные соединения через публичные get_connection/release.
+
+    Приватные списки соединений redis-py не входят в стабильный API, поэтому
+    загрузка пула считается здесь: текущее число занятых соединений и пик
+    с момента последнего снятия статистики.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.in_use = 0
+        self.peak = 0
+
+    async def get_connection(self, *args, **kwargs):
+        connection = await super().get_connection(*args, **kwargs)
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        return connection
+
+    async def release(self, connection) -> None:
+        self.in_use = max(self.in_use - 1, 0)
+        await super().release(connection)
+
+    def take_peak(self) -> int:
+        """Пик занятых соединений; счётчик пика начинается заново."""
+        peak, self.peak = self.peak, self.in_use
+        return peak
+
+
+class RedisRegistry:
+    """Общий клиент Redis процесса бота с одним ограниченным пулом соединений.
+
+    FSM-хранилище, корзины, кэши и остальные сервисы получают один и тот же
+    клиент, поэтому число соединений ограничено REDIS_MAX_CONNECTIONS. При
+    исчерпании пула запрос ждёт свободное соединение до REDIS_POOL_TIMEOUT.
+    """
+
+    def __init__(self, dsn: str = REDIS_DSN) -> None:
+        self.dsn = dsn
+        self._pool: Optional[CountingConnectionPool] = None
+        self._client: Optional[Redis] = None
+
+    def _build_pool(self) -> CountingConnectionPool:
+        return CountingConnectionPool.from_url(
+            self.dsn,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            decode_responses=True,
+        )
+
+    @property
+    def client(self) -> Redis:
+        # Соединения открываются лениво, поэтому клиент можно получать при импорте
+        if self._client is None:
+            self._pool = self._build_pool()
+            self._client = Redis(connection_pool=self._pool)
+        return self._client
+
+    async def ping(self) -> bool:
+        """Проверка доступности Redis."""
+        try:
+            return bool(await self.client.ping())
+        except RedisError as e:
+            logger.error(f"Redis недоступен: {e}")
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """Использование пула соединений: занято сейчас и пик с прошлого вызова."""
+        if self._pool is None:
+            return {"max": REDIS_MAX_CONNECTIONS, "in_use": 0, "peak": 0}
+        return {
+            "max": self._pool.max_connections,
+            "in_use": self._pool.in_use,
+            "peak": self._pool.take_peak(),
+        }
+
+    async def report_forever(self, interval: float) -> None:
+        """Периодическая запись загрузки пула в лог.
+
+        Пик, достигший max, означает, что запросы ждали свободное соединение.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.stats()
+            if stats["peak"] >= stats["max"]:
+                logger.warning(f"Пул Redis исчерпан: {stats}")
+            else:
+                logger.info(f"Пул Redis: {stats}")
+
+    async def close(self) -> None:
+        """Закрытие пула соединений (вызывается при остановке бота)."""
+        if self._client is not None:
+            logger.info(f"Пул Redis перед закрытием: {self.stats()}")
+            await self._client.aclose()
+            await self._pool.disconnect()
+            self._client = None
+            self._pool = None
+            logger.info("Пул Redis закрыт")
+
+
+class SharedRedisStorage(RedisStorage):
+    """FSM-хранилище на общем клиенте Redis.
+
+    Dispatcher закрывает хранилище первым shutdown-хуком, до остановки
+    фоновых задач, которые ещё пользуются Redis. Пул закрывает RedisRegistry.
+    """
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Объединение одновременных одинаковых запросов в один.
+
+    Пока запрос с ключом выполняется, остальные вызовы с тем же ключом
+    ожидают его результат вместо повторного обращения к бэкенду.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Выполнение fn или ожидание уже запущенного вызова с тем же ключом.
+
+        Args:
+            key: Ключ запрашиваемого ресурса.
+            fn: Фабрика корутины, выполняющей запрос.
+
+        Returns:
+            Результат общего вызова.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # shield: отмена одного ожидающего не отменяет запрос для остальных
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
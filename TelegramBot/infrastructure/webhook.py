@@ -0,0 +1,51 @@
+import asyncio
+import logging
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+
+logger = logging.getLogger(__name__)
+
+
+async def health(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+def create_webhook_app(
+    dispatcher: Dispatcher, bot: Bot, path: str, secret_token: str
+) -> web.Application:
+    """Создание aiohttp-приложения, принимающего обновления Telegram.
+
+    Запросы с неверным заголовком X-Telegram-Bot-Api-Secret-Token
+    отклоняются до передачи в Dispatcher. Startup/shutdown-хуки
+    диспетчера привязываются к жизненному циклу приложения.
+
+    Args:
+        dispatcher: Диспетчер aiogram.
+        bot: Экземпляр бота.
+        path: Путь эндпоинта вебхука.
+        secret_token: Секрет, переданный Telegram в setWebhook.
+
+    Returns:
+        web.Application: Готовое приложение.
+    """
+    app = web.Application()
+    app.router.add_get("/health", health)
+    SimpleRequestHandler(
+        dispatcher=dispatcher, bot=bot, secret_token=secret_token
+    ).register(app, path=path)
+    setup_application(app, dispatcher, bot=bot)
+    return app
+
+
+async def run_webhook_app(app: web.Application, host: str, port: int) -> None:
+    """Запуск приложения вебхука до отмены задачи."""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=host, port=port)
+    await site.start()
+    logger.info(f"Вебхук слушает {host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
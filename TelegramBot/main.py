@@ -4,9 +4,36 @@ import os
 
 from handlers import setup_handlers
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.types import BotCommand
 from dotenv import load_dotenv
-from aiogram.fsm.storage.redis import RedisStorage
+from config import (
+    BOT_MODE,
+    ORDER_EXPORT_BATCH_SIZE,
+    ORDER_EXPORT_INTERVAL,
+    ORDER_JOURNAL_PATH,
+    ORDER_OUTBOX_INTERVAL,
+    ORDER_REPORT_PATH,
+    REDIS_STATS_INTERVAL,
+    REGISTRATION_FLUSH_INTERVAL,
+    TELEGRAM_API_URL,
+    WEBHOOK_BASE_URL,
+    WEBHOOK_PATH,
+    WEBHOOK_SECRET,
+    WEBAPP_HOST,
+    WEBAPP_PORT,
+)
+from infrastructure.redis_registry import SharedRedisStorage
+from infrastructure.webhook import create_webhook_app, run_webhook_app
+from repositories.order_repository import OrderExcelRepository, OrderJournalRepository
+from services.api_provider import http_client, catalog_cache, redis_registry
+from services.faq_cache import start_faq_invalidation_listener
+from services.image_warmup import start_image_warmup
+from services.order_export import OrderExportService
+from services.order_outbox import order_outbox
+from services.payment_service import payment_service
+from services.registration_service import registration_service
 
 load_dotenv()
 TOKEN = os.getenv("BOT_TOKEN")
@@ -19,9 +46,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Используем Redis для хранения состояний FSM
-storage = RedisStorage.from_url(os.getenv("REDIS_DSN", "redis://localhost:6379/0"))
-bot = Bot(token=TOKEN)
+# Используем Redis для хранения состояний FSM (общий пул процесса)
+storage = SharedRedisStorage(redis=redis_registry.client)
+# TELEGRAM_API_URL позволяет направить бота на локальный сервер Bot API
+# (например, infrastructure/fake_telegram.py)
+session = (
+    AiohttpSession(api=TelegramAPIServer.from_base(TELEGRAM_API_URL))
+    if TELEGRAM_API_URL
+    else None
+)
+bot = Bot(token=TOKEN, session=session)
 dp = Dispatcher(storage=storage)
 
 
@@ -37,13 +71,78 @@ async def set_bot_commands(bot: Bot):
     logger.info("Команды меню Telegram успешно настроены")
 
 
+background_tasks = []
+
+
+async def on_startup(bot: Bot) -> None:
+    """Инициализация общих ресурсов процесса"""
+    await http_client.start()
+    if not await redis_registry.ping():
+        logger.warning("Redis недоступен при запуске, FSM и корзины не будут работать")
+    background_tasks.append(
+        asyncio.create_task(redis_registry.report_forever(REDIS_STATS_INTERVAL))
+    )
+    background_tasks.append(
+        asyncio.create_task(registration_service.run_forever(REGISTRATION_FLUSH_INTERVAL))
+    )
+    background_tasks.append(
+        asyncio.create_task(order_outbox.run_forever(ORDER_OUTBOX_INTERVAL))
+    )
+    background_tasks.append(start_faq_invalidation_listener())
+    order_export = OrderExportService(
+        OrderJournalRepository(ORDER_JOURNAL_PATH),
+        OrderExcelRepository(ORDER_REPORT_PATH),
+        ORDER_EXPORT_BATCH_SIZE,
+    )
+    background_tasks.append(
+        asyncio.create_task(order_export.run_forever(ORDER_EXPORT_INTERVAL))
+    )
+    warmup_task = start_image_warmup(bot)
+    if warmup_task:
+        background_tasks.append(warmup_task)
+
+
+async def on_shutdown() -> None:
+    """Освобождение общих ресурсов процесса"""
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    logger.info(f"Статистика кэша каталога: {catalog_cache.stats()}")
+    logger.info(f"Ответов 304 от бэкенда: {http_client.not_modified}")
+    await http_client.close()
+    await payment_service.gateway.close()
+    await redis_registry.close()
+
+
+async def on_webhook_startup(bot: Bot) -> None:
+    """Регистрация вебхука в Telegram"""
+    await bot.set_webhook(
+        f"{WEBHOOK_BASE_URL}{WEBHOOK_PATH}",
+        secret_token=WEBHOOK_SECRET,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+    logger.info(f"Вебхук установлен: {WEBHOOK_BASE_URL}{WEBHOOK_PATH}")
+
+
 async def main():
     setup_handlers(dp)
+    dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
 
     await set_bot_commands(bot)
 
+    if BOT_MODE == "webhook":
+        if not WEBHOOK_BASE_URL or not WEBHOOK_SECRET:
+            raise RuntimeError("Для режима webhook нужны WEBHOOK_BASE_URL и WEBHOOK_SECRET")
+        dp.startup.register(on_webhook_startup)
+        app = create_webhook_app(dp, bot, WEBHOOK_PATH, WEBHOOK_SECRET)
+        logger.info("Бот запущен в режиме webhook...")
+        await run_webhook_app(app, WEBAPP_HOST, WEBAPP_PORT)
+        return
+
     logger.info("Бот запущен...")
-    await dp.start_polling(bot)
+    await bot.delete_webhook()
+    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import hashlib
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -8,28 +9,18 @@ from models.catalog import Product
 class CartItem:
     product: Product
     quantity: int
+    # Цена на момент добавления в корзину
+    price: Optional[float] = None
 
-    @classmethod
-    def from_dict(cls, data: dict):
-        product = Product.from_dict(data["product"])
-        return cls(product=product, quantity=data["quantity"])
-
-    def to_dict(self):
-        return {"product": vars(self.product), "quantity": self.quantity}
+    def __post_init__(self):
+        if self.price is None:
+            self.price = self.product.price
 
 
 @dataclass
 class Cart:
     items: List[CartItem]
 
-    @classmethod
-    def from_dict(cls, data: dict):
-        items = [CartItem.from_dict(item) for item in data.get("items", [])]
-        return cls(items=items)
-
-    def to_dict(self):
-        return {"items": [item.to_dict() for item in self.items]}
-
     def add_item(self, product: Product, quantity: int):
         for item in self.items:
             if item.product.id == product.id:
@@ -41,7 +32,14 @@ class Cart:
         self.items = [item for item in self.items if item.product.id != product_id]
 
     def get_total(self) -> float:
-        return sum(item.product.price * item.quantity for item in self.items)
+        return sum(item.price * item.quantity for item in self.items)
 
     def is_empty(self) -> bool:
         return len(self.items) == 0
+
+    def content_hash(self) -> str:
+        # Не зависит от порядка позиций: одинаковые корзины дают один хэш
+        content = ";".join(
+            sorted(f"{item.product.id}:{item.quantity}:{item.price}" for item in self.items)
+        )
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
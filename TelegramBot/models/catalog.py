@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -38,6 +38,7 @@ class Product:
     description: str
     price: float
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -48,4 +49,5 @@ class Product:
             description=data["description"],
             price=float(data["price"]),
             image_url=data.get("image_url"),
+            image_variants=data.get("image_variants"),
         )
@@ -0,0 +1,127 @@
+import asyncio
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional
+import logging
+from infrastructure.cache import TwoTierCache
+from infrastructure.singleflight import SingleFlight
+from repositories.catalog_repository import CatalogRepository
+from models.catalog import Category, Subcategory, Product
+
+logger = logging.getLogger(__name__)
+
+
+class CachedCatalogRepository:
+    """Кэширующая обёртка над CatalogRepository с тем же интерфейсом.
+
+    Пустые ответы не кэшируются: CatalogRepository возвращает их и при ошибках
+    бэкенда, и такой ответ не должен «залипать» в кэше. Одновременные промахи
+    по одному ключу объединяются в один запрос к бэкенду.
+    """
+
+    def __init__(self, repository: CatalogRepository, cache: TwoTierCache):
+        self.repository = repository
+        self.cache = cache
+        self._flight = SingleFlight()
+
+    async def get_categories(self) -> List[Category]:
+        cached = await self.cache.get("categories")
+        if cached is not None:
+            return [Category.from_dict(item) for item in cached]
+        return await self._flight.do("categories", self._load_categories)
+
+    async def _load_categories(self) -> List[Category]:
+        categories = await self.repository.get_categories()
+        if categories:
+            await self.cache.set("categories", [asdict(c) for c in categories])
+        return categories
+
+    async def get_subcategories(self, category_id: int) -> List[Subcategory]:
+        key = f"subcategories:{category_id}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return [Subcategory.from_dict(item) for item in cached]
+        return await self._flight.do(
+            key, lambda: self._load_subcategories(key, category_id)
+        )
+
+    async def _load_subcategories(self, key: str, category_id: int) -> List[Subcategory]:
+        subcategories = await self.repository.get_subcategories(category_id)
+        if subcategories:
+            await self.cache.set(key, [asdict(s) for s in subcategories])
+        return subcategories
+
+    async def get_products(
+        self, subcategory_id: int, page: int = 1, limit: int = 5
+    ) -> Dict[str, Any]:
+        key = f"products:{subcategory_id}:{page}:{limit}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return {
+                **cached,
+                "products": [Product.from_dict(item) for item in cached["products"]],
+            }
+        return await self._flight.do(
+            key, lambda: self._load_products(key, subcategory_id, page, limit)
+        )
+
+    async def _load_products(
+        self, key: str, subcategory_id: int, page: int, limit: int
+    ) -> Dict[str, Any]:
+        data = await self.repository.get_products(subcategory_id, page, limit)
+        if data["products"]:
+            await self.cache.set(
+                key, {**data, "products": [asdict(p) for p in data["products"]]}
+            )
+        return data
+
+    async def search_products(
+        self, query: str, page: int = 1, limit: int = 20
+    ) -> Dict[str, Any]:
+        query = " ".join(query.lower().split())
+        key = f"search:{query}:{page}:{limit}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return {
+                **cached,
+                "products": [Product.from_dict(item) for item in cached["products"]],
+            }
+        return await self._flight.do(
+            key, lambda: self._load_search(key, query, page, limit)
+        )
+
+    async def _load_search(
+        self, key: str, query: str, page: int, limit: int
+    ) -> Dict[str, Any]:
+        data = await self.repository.search_products(query, page, limit)
+        # Выдача поиска, как и product:<id>, устаревает по TTL кэша каталога и
+        # сбрасывается вместе с ним в invalidate(); точечной очистки нет
+        if data["products"]:
+            await self.cache.set(
+                key, {**data, "products": [asdict(p) for p in data["products"]]}
+            )
+            # Карточка товара, открытая из результатов поиска, берётся из кэша
+            await asyncio.gather(
+                *(
+                    self.cache.set(f"product:{product.id}", asdict(product))
+                    for product in data["products"]
+                )
+            )
+        return data
+
+    async def get_product(self, product_id: int) -> Optional[Product]:
+        key = f"product:{product_id}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return Product.from_dict(cached)
+        return await self._flight.do(key, lambda: self._load_product(key, product_id))
+
+    async def _load_product(self, key: str, product_id: int) -> Optional[Product]:
+        product = await self.repository.get_product(product_id)
+        if product:
+            await self.cache.set(key, asdict(product))
+        return product
+
+    async def invalidate(self) -> None:
+        """Сброс всего кэша каталога (например, после импорта товаров)."""
+        await self.cache.invalidate()
+        logger.info("Кэш каталога сброшен")
@@ -55,6 +55,24 @@ class CatalogRepository:
             logger.error(f"Ошибка при получении товаров: {e}")
             return {"products": [], "total": 0, "pages": 0}
 
+    async def search_products(
+        self, query: str, page: int = 1, limit: int = 20
+    ) -> Dict[str, Any]:
+        try:
+            data = await self.http_client.request(
+                "get",
+                "/api/products/search/",
+                params={"q": query, "page": page, "limit": limit},
+            )
+            return {
+                "products": [Product.from_dict(item) for item in data.get("results", [])],
+                "total": data.get("count", 0),
+                "has_next": bool(data.get("next")),
+            }
+        except Exception as e:
+            logger.error(f"Ошибка при поиске товаров по запросу '{query}': {e}")
+            return {"products": [], "total": 0, "has_next": False}
+
     async def get_product(self, product_id: int) -> Optional[Product]:
         try:
             data = await self.http_client.request("get", f"/api/products/{product_id}/")
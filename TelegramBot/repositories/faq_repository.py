@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 import logging
 from infrastructure.http_client import HttpClient
+from infrastructure.singleflight import SingleFlight
 from models.faq import FAQ
 
 logger = logging.getLogger(__name__)
@@ -9,8 +10,13 @@ logger = logging.getLogger(__name__)
 class FAQRepository:
     def __init__(self, http_client: HttpClient):
         self.http_client = http_client
+        self._flight = SingleFlight()
 
-    async def get_faq(self) -> List[FAQ]:
+    async def get_faq(self) -> Optional[List[FAQ]]:
+        """Список FAQ или None, если бэкенд недоступен (в отличие от пустого списка)."""
+        return await self._flight.do("faq", self._fetch_faq)
+
+    async def _fetch_faq(self) -> Optional[List[FAQ]]:
         try:
             data = await self.http_client.request("get", "/api/faq/")
             if not data or "results" not in data:
@@ -19,4 +25,4 @@ class FAQRepository:
             return [FAQ.from_dict(item) for item in data["results"]]
         except Exception as e:
             logger.error(f"Ошибка при получении FAQ: {e}")
-            return []
+            return None
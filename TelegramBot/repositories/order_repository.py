@@ -1,56 +1,307 @@
-from openpyxl import load_workbook, Workbook
-from typing import Dict, Any
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from openpyxl import Workbook, load_workbook
+from typing import Dict, Any, Iterator, List, Optional
 from models.cart import CartItem
 
+HEADER = [
+    "Order ID",
+    "User ID",
+    "Total",
+    "Name",
+    "Address",
+    "Phone",
+    "Status",
+    "Items",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class OrderJournalRepository:
+    """Журнал заказов в SQLite, в который заказы только дописываются.
+
+    Запись выполняется в отдельном потоке и не блокирует цикл событий.
+    Режим WAL и busy_timeout позволяют писать в журнал из нескольких
+    процессов бота и читать его экспортёром одновременно с записью.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Инициализация репозитория с указанием пути к базе.
+
+        Args:
+            db_path: Путь к файлу SQLite журнала заказов.
+        """
+        self._db_path = db_path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._db_path, timeout=10)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS orders (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    order_id TEXT NOT NULL UNIQUE,
+                    user_id INTEGER NOT NULL,
+                    total REAL NOT NULL,
+                    name TEXT,
+                    address TEXT,
+                    phone TEXT,
+                    status TEXT,
+                    items TEXT NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    @staticmethod
+    def _serialize_items(items: List[CartItem]) -> str:
+        return json.dumps(
+            [
+                {
+                    "product_id": item.product.id,
+                    "name": item.product.name,
+                    "quantity": item.quantity,
+                    "price": item.price,
+                }
+                for item in items
+            ],
+            ensure_ascii=False,
+        )
+
+    def _append(self, order: Dict[str, Any]) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR IGNORE INTO orders "
+                    "(order_id, user_id, total, name, address, phone, status, items) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        order["id"],
+                        order["user_id"],
+                        order["total"],
+                        order["name"],
+                        order["address"],
+                        order["phone"],
+                        order["status"],
+                        self._serialize_items(order["items"]),
+                    ),
+                )
+        finally:
+            connection.close()
+
+    async def save_order(self, order: Dict[str, Any]) -> None:
+        """Добавление заказа в журнал.
+
+        Args:
+            order: Данные заказа для сохранения.
+        """
+        await asyncio.to_thread(self._append, order)
+
+    @staticmethod
+    def _parse_legacy_items(items: Optional[str]) -> List[Dict[str, Any]]:
+        # Формат старого отчёта: "Товар A x2; Товар B x1"
+        parsed = []
+        for part in (items or "").split("; "):
+            name, sep, quantity = part.rpartition(" x")
+            if not sep or not quantity.isdigit():
+                name, quantity = part, "1"
+            if name:
+                parsed.append({"name": name, "quantity": int(quantity)})
+        return parsed
+
+    def import_legacy_report(self, file_path: str) -> int:
+        """Однократный перенос заказов из Excel-отчёта старого формата.
+
+        До журнала заказы хранились только в orders.xlsx. Отчёт теперь
+        строится из журнала, поэтому перед первым экспортом строки старого
+        файла переносятся в журнал. Факт переноса отмечается в таблице meta,
+        повторные вызовы (в том числе из других процессов) ничего не делают.
+
+        Args:
+            file_path: Путь к отчёту старого формата.
+
+        Returns:
+            int: Количество перенесённых заказов.
+        """
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            done = connection.execute(
+                "SELECT value FROM meta WHERE key = 'legacy_import'"
+            ).fetchone()
+            if done:
+                connection.rollback()
+                return 0
+            imported = 0
+            if os.path.exists(file_path):
+                wb = load_workbook(file_path, read_only=True)
+                try:
+                    rows = wb.active.iter_rows(min_row=2, values_only=True)
+                    for row in rows:
+                        if not row or row[0] is None:
+                            continue
+                        order_id, user_id, total, name, address, phone, status, items = (
+                            list(row) + [None] * len(HEADER)
+                        )[: len(HEADER)]
+                        cursor = connection.execute(
+                            "INSERT OR IGNORE INTO orders "
+                            "(order_id, user_id, total, name, address, phone, status, items) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                str(order_id),
+                                int(user_id or 0),
+                                float(total or 0),
+                                name,
+                                address,
+                                phone if phone is None else str(phone),
+                                status,
+                                json.dumps(
+                                    self._parse_legacy_items(items), ensure_ascii=False
+                                ),
+                            ),
+                        )
+                        imported += cursor.rowcount
+                finally:
+                    wb.close()
+            connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_import', ?)",
+                (str(imported),),
+            )
+            connection.commit()
+            return imported
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def last_seq(self) -> int:
+        """Порядковый номер последней записи журнала (0, если журнал пуст)."""
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT COALESCE(MAX(seq), 0) FROM orders").fetchone()[0]
+        finally:
+            connection.close()
+
+    def iter_orders(self, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """Чтение всех заказов журнала пачками по batch_size строк.
+
+        Args:
+            batch_size: Размер пачки.
+
+        Yields:
+            Dict[str, Any]: Заказ с позициями в виде списка словарей.
+        """
+        connection = self._connect()
+        connection.row_factory = sqlite3.Row
+        try:
+            last_seq = 0
+            while True:
+                rows = connection.execute(
+                    "SELECT * FROM orders WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last_seq, batch_size),
+                ).fetchall()
+                if not rows:
+                    return
+                for row in rows:
+                    yield {**dict(row), "items": json.loads(row["items"])}
+                last_seq = rows[-1]["seq"]
+        finally:
+            connection.close()
+
 
 class OrderExcelRepository:
-    """Репозиторий для сохранения заказов в Excel."""
+    """Отчёт по заказам в Excel, формируемый из журнала заказов."""
 
     def __init__(self, file_path: str) -> None:
         """Инициализация репозитория с указанием пути к файлу.
 
         Args:
-            file_path: Путь к файлу Excel для хранения заказов.
+            file_path: Путь к файлу Excel для отчёта по заказам.
         """
         self._file_path = file_path
-        self._header = [
-            "Order ID",
-            "User ID",
-            "Total",
-            "Name",
-            "Address",
-            "Phone",
-            "Status",
-            "Items",
-        ]
-
-    def save_order(self, order: Dict[str, Any]) -> None:
-        """Сохранение заказа в Excel-файл.
+        self._header = HEADER
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def export(self, orders: Iterator[Dict[str, Any]]) -> Optional[int]:
+        """Запись отчёта в режиме write-only.
+
+        Строки пишутся потоком, без загрузки книги в память. Отчёт сначала
+        сохраняется в уникальный временный файл рядом с отчётом и затем
+        атомарно заменяет прежний. Экспорт из нескольких процессов
+        сериализуется блокировкой файла <отчёт>.lock: если отчёт сейчас
+        пишет другой процесс, экспорт пропускается.
 
         Args:
-            order: Данные заказа для сохранения.
+            orders: Заказы из журнала.
+
+        Returns:
+            Optional[int]: Количество записанных заказов или None, если
+            экспорт пропущен из-за блокировки.
         """
-        try:
-            wb = load_workbook(self._file_path)
-        except FileNotFoundError:
-            wb = Workbook()
-            ws = wb.active
-            ws.append(self._header)
-
-        ws = wb.active
-        items_str = "; ".join(
-            [f"{item.product.name} x{item.quantity}" for item in order["items"]]
-        )
-        ws.append(
-            [
-                order["id"],
-                order["user_id"],
-                order["total"],
-                order["name"],
-                order["address"],
-                order["phone"],
-                order["status"],
-                items_str,
-            ]
-        )
-        wb.save(self._file_path)
+        directory = os.path.dirname(os.path.abspath(self._file_path))
+        with open(f"{self._file_path}.lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info("Отчёт по заказам формирует другой процесс, экспорт пропущен")
+                return None
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=directory, prefix=".orders-", suffix=".xlsx.tmp"
+                )
+                os.close(fd)
+                # mkstemp создаёт файл с правами 0600, отчёт должен читаться как раньше
+                os.chmod(tmp_path, 0o644)
+                try:
+                    count = self._write(orders, tmp_path)
+                    os.replace(tmp_path, self._file_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                return count
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, orders: Iterator[Dict[str, Any]], path: str) -> int:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(self._header)
+        count = 0
+        for order in orders:
+            items_str = "; ".join(
+                f"{item['name']} x{item['quantity']}" for item in order["items"]
+            )
+            ws.append(
+                [
+                    order["order_id"],
+                    order["user_id"],
+                    order["total"],
+                    order["name"],
+                    order["address"],
+                    order["phone"],
+                    order["status"],
+                    items_str,
+                ]
+            )
+            count += 1
+        wb.save(path)
+        return count
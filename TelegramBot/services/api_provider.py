@@ -1,9 +1,25 @@
+from config import (
+    CATALOG_CACHE_MAX_SIZE,
+    CATALOG_CACHE_LOCAL_TTL,
+    CATALOG_CACHE_REDIS_TTL,
+)
+from infrastructure.cache import TwoTierCache
 from infrastructure.http_client import HttpClient
+from infrastructure.redis_registry import RedisRegistry
 from repositories.catalog_repository import CatalogRepository
+from repositories.cached_catalog_repository import CachedCatalogRepository
 from repositories.faq_repository import FAQRepository
 
 http_client = HttpClient()
-catalog_repo = CatalogRepository(http_client)
+redis_registry = RedisRegistry()
+catalog_cache = TwoTierCache(
+    redis_registry.client,
+    namespace="catalog",
+    max_size=CATALOG_CACHE_MAX_SIZE,
+    local_ttl=CATALOG_CACHE_LOCAL_TTL,
+    redis_ttl=CATALOG_CACHE_REDIS_TTL,
+)
+catalog_repo = CachedCatalogRepository(CatalogRepository(http_client), catalog_cache)
 faq_repo = FAQRepository(http_client)
 
 
@@ -1,19 +1,126 @@
-import json
+import asyncio
 from redis.asyncio import Redis
-from models.cart import Cart
-from typing import List
+from models.cart import Cart, CartItem
+from models.catalog import Product
+from services.api_provider import api_provider, redis_registry
+from typing import Dict, List, Optional
+
+# Все скрипты работают с ключами: KEYS[1] — количества, KEYS[2] — цены,
+# KEYS[3] — корзина старого формата (JSON-строка), которая переносится
+# в хэши при первом обращении. Каждый скрипт возвращает новое состояние
+# корзины, поэтому изменение и чтение укладываются в один запрос к Redis.
+_PRELUDE = """
+local legacy = redis.call('GET', KEYS[3])
+if legacy then
+    local cart = cjson.decode(legacy)
+    for _, item in ipairs(cart['items'] or {}) do
+        local product = item['product']
+        redis.call('HINCRBY', KEYS[1], product['id'], item['quantity'])
+        redis.call('HSETNX', KEYS[2], product['id'], tostring(product['price']))
+    end
+    redis.call('DEL', KEYS[3])
+end
+"""
+
+_STATE = """
+return {redis.call('HGETALL', KEYS[1]), redis.call('HGETALL', KEYS[2])}
+"""
+
+GET_SCRIPT = _PRELUDE + _STATE
+
+ADD_SCRIPT = _PRELUDE + """
+redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+""" + _STATE
+
+# Уменьшение количества с удалением позиции, если оно стало <= 0
+DECREMENT_SCRIPT = _PRELUDE + """
+local quantity = redis.call('HINCRBY', KEYS[1], ARGV[1], -tonumber(ARGV[2]))
+if quantity <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+end
+""" + _STATE
+
+REMOVE_SCRIPT = _PRELUDE + """
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+""" + _STATE
+
+# Сумма корзины, вычисляемая на стороне Redis
+TOTAL_SCRIPT = _PRELUDE + """
+local items = redis.call('HGETALL', KEYS[1])
+local total = 0
+for i = 1, #items, 2 do
+    local price = redis.call('HGET', KEYS[2], items[i])
+    if price then
+        total = total + tonumber(price) * tonumber(items[i + 1])
+    end
+end
+return tostring(total)
+"""
 
 
 class CartService:
-    """Сервис для управления корзиной пользователя."""
+    """Сервис для управления корзиной пользователя.
+
+    Корзина хранится в двух хэшах Redis: cart:<user_id>:items (id товара ->
+    количество) и cart:<user_id>:prices (id товара -> цена на момент
+    добавления), поэтому добавление и удаление позиций выполняются атомарно,
+    без чтения всей корзины. Название, описание и изображение товара в Redis
+    не хранятся и подставляются при чтении из кэша каталога.
+    """
 
-    def __init__(self, redis_dsn: str) -> None:
+    def __init__(self, redis_client: Redis, catalog) -> None:
         """Инициализация сервиса с подключением к Redis.
 
         Args:
-            redis_dsn: Строка подключения к Redis.
+            redis_client: Общий клиент Redis процесса.
+            catalog: Репозиторий каталога для получения данных товаров.
         """
-        self._redis_client = Redis.from_url(redis_dsn, decode_responses=True)
+        self._redis_client = redis_client
+        self._catalog = catalog
+        self._get = self._redis_client.register_script(GET_SCRIPT)
+        self._add = self._redis_client.register_script(ADD_SCRIPT)
+        self._decrement = self._redis_client.register_script(DECREMENT_SCRIPT)
+        self._remove = self._redis_client.register_script(REMOVE_SCRIPT)
+        self._total = self._redis_client.register_script(TOTAL_SCRIPT)
+
+    @staticmethod
+    def _keys(user_id: int) -> List[str]:
+        # Хэши корзины и ключ корзины старого формата (JSON-строка)
+        return [f"cart:{user_id}:items", f"cart:{user_id}:prices", f"cart:{user_id}"]
+
+    @staticmethod
+    def _pairs(flat: List[str]) -> Dict[str, str]:
+        return dict(zip(flat[::2], flat[1::2]))
+
+    async def _build_cart(self, state: List[List[str]]) -> Cart:
+        """Сборка корзины из ответа скрипта с подстановкой данных товаров."""
+        quantities, prices = self._pairs(state[0]), self._pairs(state[1])
+        product_ids = [int(product_id) for product_id in quantities]
+        products = await asyncio.gather(
+            *(self._catalog.get_product(product_id) for product_id in product_ids)
+        )
+        items = []
+        for product_id, product in zip(product_ids, products):
+            price: Optional[str] = prices.get(str(product_id))
+            if product is None:
+                product = Product(
+                    id=product_id,
+                    subcategory_id=0,
+                    name=f"Товар #{product_id}",
+                    description="",
+                    price=float(price or 0),
+                )
+            items.append(
+                CartItem(
+                    product=product,
+                    quantity=int(quantities[str(product_id)]),
+                    price=float(price) if price is not None else None,
+                )
+            )
+        return Cart(items=items)
 
     async def get_cart(self, user_id: int) -> Cart:
         """Получение корзины пользователя из Redis.
@@ -24,19 +131,79 @@ class CartService:
         Returns:
             Cart: Объект корзины пользователя.
         """
-        cart_data = await self._redis_client.get(f"cart:{user_id}")
-        if cart_data:
-            return Cart.from_dict(json.loads(cart_data))
-        return Cart(items=[])
+        return await self._build_cart(await self._get(keys=self._keys(user_id)))
 
     async def save_cart(self, user_id: int, cart: Cart) -> None:
-        """Сохранение корзины пользователя в Redis.
+        """Сохранение корзины пользователя в Redis целиком.
 
         Args:
             user_id: Идентификатор пользователя.
             cart: Объект корзины для сохранения.
         """
-        await self._redis_client.set(f"cart:{user_id}", json.dumps(cart.to_dict()))
+        items_key, prices_key, legacy_key = self._keys(user_id)
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(items_key, prices_key, legacy_key)
+            if not cart.is_empty():
+                pipe.hset(
+                    items_key,
+                    mapping={item.product.id: item.quantity for item in cart.items},
+                )
+                pipe.hset(
+                    prices_key,
+                    mapping={item.product.id: item.price for item in cart.items},
+                )
+            await pipe.execute()
+
+    async def add_item(self, user_id: int, product: Product, quantity: int) -> Cart:
+        """Атомарное добавление товара в корзину.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            product: Добавляемый товар.
+            quantity: Количество.
+
+        Returns:
+            Cart: Корзина после изменения.
+        """
+        state = await self._add(
+            keys=self._keys(user_id), args=[product.id, quantity, product.price]
+        )
+        return await self._build_cart(state)
+
+    async def decrement_item(self, user_id: int, product_id: int, quantity: int = 1) -> Cart:
+        """Атомарное уменьшение количества товара (позиция удаляется при нуле).
+
+        Args:
+            user_id: Идентификатор пользователя.
+            product_id: Идентификатор товара.
+            quantity: На сколько уменьшить.
+
+        Returns:
+            Cart: Корзина после изменения.
+        """
+        state = await self._decrement(keys=self._keys(user_id), args=[product_id, quantity])
+        return await self._build_cart(state)
+
+    async def remove_item(self, user_id: int, product_id: int) -> Cart:
+        """Атомарное удаление позиции из корзины.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            product_id: Идентификатор товара.
+
+        Returns:
+            Cart: Корзина после изменения.
+        """
+        state = await self._remove(keys=self._keys(user_id), args=[product_id])
+        return await self._build_cart(state)
+
+    async def get_total(self, user_id: int) -> float:
+        """Сумма корзины, вычисленная на стороне Redis.
+
+        Args:
+            user_id: Идентификатор пользователя.
+        """
+        return float(await self._total(keys=self._keys(user_id)))
 
     async def clear_cart(self, user_id: int) -> None:
         """Очистка корзины пользователя в Redis.
@@ -44,4 +211,7 @@ class CartService:
         Args:
             user_id: Идентификатор пользователя.
         """
-        await self._redis_client.delete(f"cart:{user_id}")
+        await self._redis_client.delete(*self._keys(user_id))
+
+
+cart_service = CartService(redis_registry.client, api_provider.catalog)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Dict
+from redis.asyncio import Redis
+from models.cart import Cart
+from services.api_provider import redis_registry
+from services.payment_service import PaymentService, payment_service
+from config import CHECKOUT_LOCK_TTL, CHECKOUT_SESSION_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class CheckoutService:
+    """Идемпотентное оформление заказа.
+
+    Ключ идемпотентности — пользователь и хэш содержимого корзины. Первый
+    запрос резервирует ключ в Redis (SET NX) и создаёт платёжную сессию,
+    повторные запросы с той же корзиной получают уже созданный заказ и
+    ссылку на оплату без обращения к платёжному шлюзу. После оформления
+    ключ удаляется (complete), поэтому повторная покупка тех же товаров
+    создаёт новый заказ и новую сессию.
+    """
+
+    def __init__(self, redis_client: Redis, payments: PaymentService) -> None:
+        """Инициализация сервиса.
+
+        Args:
+            redis_client: Общий клиент Redis процесса.
+            payments: Сервис платежей.
+        """
+        self._redis_client = redis_client
+        self._payments = payments
+
+    @staticmethod
+    def _key(user_id: int, cart: Cart) -> str:
+        return f"checkout:{user_id}:{cart.content_hash()}"
+
+    async def checkout(self, user_id: int, cart: Cart) -> Dict[str, Any]:
+        """Получение платёжной сессии для корзины пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            cart: Корзина пользователя.
+
+        Returns:
+            Dict[str, Any]: order_id, confirmation_url и признак reused
+            (сессия создана ранее) либо error.
+        """
+        key = self._key(user_id, cart)
+        order_id = str(uuid.uuid4())
+        # Пока сессия создаётся, ключ живёт CHECKOUT_LOCK_TTL секунд
+        reserved = await self._redis_client.set(
+            key, json.dumps({"order_id": order_id}), nx=True, ex=CHECKOUT_LOCK_TTL
+        )
+        if not reserved:
+            cached = json.loads(await self._redis_client.get(key) or "{}")
+            if cached.get("confirmation_url"):
+                logger.info(f"Повторное оформление заказа {cached['order_id']}, user_id: {user_id}")
+                return {**cached, "reused": True}
+            return {"error": "Заказ уже формируется, подождите несколько секунд"}
+
+        # Резерв снимается при любой неудаче, иначе повтор считается дублем
+        try:
+            payment = await self._payments.create_payment(cart.get_total(), order_id)
+        except asyncio.CancelledError:
+            await self._redis_client.delete(key)
+            raise
+        except Exception as e:
+            logger.error(f"Ошибка создания платежа для заказа {order_id}: {e}")
+            await self._redis_client.delete(key)
+            return {"error": "Не удалось создать платёж, попробуйте ещё раз"}
+        if "error" in payment:
+            await self._redis_client.delete(key)
+            return payment
+
+        session = {
+            "order_id": order_id,
+            "confirmation_url": payment["confirmation_url"],
+            "session_id": payment.get("session_id"),
+        }
+        await self._redis_client.set(key, json.dumps(session), ex=CHECKOUT_SESSION_TTL)
+        return {**session, "reused": False}
+
+    async def complete(self, user_id: int, cart: Cart) -> None:
+        """Завершение оформления: сессия больше не переиспользуется.
+
+        Вызывается после того, как заказ поставлен в очередь и корзина
+        очищена. Переиспользование возможно только для повторов, пришедших
+        до этого момента.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            cart: Корзина, по которой оформлялся заказ.
+        """
+        await self._redis_client.delete(self._key(user_id, cart))
+
+
+checkout_service = CheckoutService(redis_registry.client, payment_service)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from models.faq import FAQ
+from repositories.faq_repository import FAQRepository
+from services.faq_search import FAQSearchIndex
+from services.api_provider import api_provider, redis_registry
+from config import FAQ_CACHE_TTL, FAQ_INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Ожидание сообщения pub/sub; должно быть меньше REDIS_SOCKET_TIMEOUT
+PUBSUB_POLL_TIMEOUT = 1.0
+
+
+class FAQCache:
+    """Кэш FAQ процесса бота с индексом по id.
+
+    Первый запрос ждёт загрузки, дальше обработчики всегда получают данные
+    из памяти: по истечении TTL кэш обновляется в фоне (stale-while-revalidate),
+    а изменения из админки Django приходят через Redis pub/sub и запускают
+    обновление сразу. Если бэкенд недоступен, остаются прежние данные.
+    """
+
+    def __init__(self, repository: FAQRepository, ttl: float) -> None:
+        """Инициализация кэша.
+
+        Args:
+            repository: Репозиторий FAQ.
+            ttl: Через сколько секунд данные считаются устаревшими.
+        """
+        self._repository = repository
+        self._ttl = ttl
+        self._items: List[FAQ] = []
+        self._by_id: Dict[int, FAQ] = {}
+        self._index = FAQSearchIndex()
+        self._loaded_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_pending = False
+
+    async def refresh(self) -> None:
+        """Загрузка FAQ из бэкенда и замена кэша."""
+        faq_list = await self._repository.get_faq()
+        if faq_list is None:
+            logger.warning("FAQ не обновлены: бэкенд недоступен, используются прежние данные")
+            return
+        self._items = faq_list
+        self._by_id = {faq.id: faq for faq in faq_list}
+        reindexed = self._index.update(faq_list)
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"Кэш FAQ обновлён, вопросов: {len(faq_list)}, переиндексировано: {reindexed}"
+        )
+
+    def refresh_in_background(self) -> None:
+        """Запуск фонового обновления.
+
+        Если обновление уже идёт, после него выполняется ещё одно: изменение
+        могло произойти после того, как текущий запрос получил ответ.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_pending = True
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_until_settled())
+
+    async def _refresh_until_settled(self) -> None:
+        while True:
+            self._refresh_pending = False
+            await self.refresh()
+            if not self._refresh_pending:
+                return
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded_at is None:
+            await self.refresh()
+        elif time.monotonic() - self._loaded_at > self._ttl:
+            self.refresh_in_background()
+
+    async def get_all(self) -> List[FAQ]:
+        """Все вопросы FAQ."""
+        await self._ensure_loaded()
+        return self._items
+
+    async def get(self, faq_id: int) -> Optional[FAQ]:
+        """Вопрос FAQ по id."""
+        await self._ensure_loaded()
+        return self._by_id.get(faq_id)
+
+    async def search(self, query: str, limit: int = 50) -> List[FAQ]:
+        """Поиск по вопросам и ответам FAQ с ранжированием."""
+        await self._ensure_loaded()
+        return self._index.search(query, limit)
+
+    async def listen_invalidations(self, redis_client: Redis, channel: str) -> None:
+        """Подписка на изменения FAQ из Django с переподключением при сбоях."""
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(channel)
+                logger.info(f"Подписка на изменения FAQ: {channel}")
+                # Изменения, пропущенные без подписки, подтягиваем сразу
+                self.refresh_in_background()
+                while True:
+                    # Чтение с явным таймаутом: пустой ответ — норма, а не ошибка.
+                    # Блокирующий listen() в redis 5.x ограничен socket_timeout пула
+                    # и через несколько секунд тишины падал с TimeoutError
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=PUBSUB_POLL_TIMEOUT
+                    )
+                    if message is None:
+                        continue
+                    logger.info(f"Изменение FAQ: {message['data']}")
+                    self.refresh_in_background()
+            except asyncio.CancelledError:
+                raise
+            except RedisError as e:
+                logger.warning(f"Подписка на изменения FAQ прервана: {e}")
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+
+
+faq_cache = FAQCache(api_provider.faq, FAQ_CACHE_TTL)
+
+
+def start_faq_invalidation_listener() -> asyncio.Task:
+    """Запуск фоновой подписки на изменения FAQ."""
+    return asyncio.create_task(
+        faq_cache.listen_invalidations(redis_registry.client, FAQ_INVALIDATION_CHANNEL)
+    )
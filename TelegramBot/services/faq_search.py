@@ -0,0 +1,174 @@
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+import snowballstemmer
+from models.faq import FAQ
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Вес совпадения в зависимости от поля и способа совпадения
+QUESTION_WEIGHT = 3.0
+ANSWER_WEIGHT = 1.0
+PREFIX_FACTOR = 0.8
+FUZZY_FACTOR = 0.6
+FUZZY_MIN_SIMILARITY = 0.4
+PHRASE_BONUS = 2.0
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FAQSearchIndex:
+    """Поисковый индекс FAQ: обратный индекс по основам слов и триграммы.
+
+    Вопросы и ответы разбиваются на слова и приводятся к основе стеммером
+    Snowball для русского языка, поэтому «доставка» находит «доставки».
+    Последнее слово запроса ищется и по префиксу (пользователь ещё печатает),
+    слова с опечатками — по сходству триграмм со словарём индекса. Результаты
+    ранжируются по TF-IDF с большим весом совпадений в вопросе.
+
+    Индекс обновляется инкрементально: при update() переиндексируются только
+    добавленные, изменённые и удалённые вопросы.
+    """
+
+    def __init__(self) -> None:
+        self._stemmer = snowballstemmer.stemmer("russian")
+        # Стеммер Snowball на чистом Python медленный, а словарь FAQ невелик
+        self._stems: Dict[str, str] = {}
+        self._documents: Dict[int, Tuple[str, str]] = {}
+        self._faqs: Dict[int, FAQ] = {}
+        # основа -> {id вопроса: вес}
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        # триграмма -> основы
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._terms: List[str] = []
+
+    def _stem(self, word: str, remember: bool = True) -> str:
+        stem = self._stems.get(word)
+        if stem is None:
+            stem = self._stemmer.stemWord(word)
+            # Слова запросов не запоминаем: их набор не ограничен
+            if remember:
+                self._stems[word] = stem
+        return stem
+
+    def _tokens(self, text: str) -> List[str]:
+        return [self._stem(word) for word in TOKEN_RE.findall(text.lower().replace("ё", "е"))]
+
+    def _add(self, faq: FAQ) -> None:
+        weights: Dict[str, float] = defaultdict(float)
+        for term in self._tokens(faq.question):
+            weights[term] += QUESTION_WEIGHT
+        for term in self._tokens(faq.answer):
+            weights[term] += ANSWER_WEIGHT
+        for term, weight in weights.items():
+            if not self._postings[term]:
+                for gram in trigrams(term):
+                    self._trigrams[gram].add(term)
+            self._postings[term][faq.id] = weight
+        self._documents[faq.id] = (faq.question, faq.answer)
+        self._faqs[faq.id] = faq
+
+    def _remove(self, faq_id: int) -> None:
+        question, answer = self._documents.pop(faq_id)
+        self._faqs.pop(faq_id)
+        for term in set(self._tokens(question)) | set(self._tokens(answer)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(faq_id, None)
+            if not postings:
+                del self._postings[term]
+                for gram in trigrams(term):
+                    self._trigrams[gram].discard(term)
+                    if not self._trigrams[gram]:
+                        del self._trigrams[gram]
+
+    def update(self, faqs: Iterable[FAQ]) -> int:
+        """Синхронизация индекса со списком FAQ.
+
+        Returns:
+            int: Количество переиндексированных вопросов.
+        """
+        incoming = {faq.id: faq for faq in faqs}
+        changed: Set[int] = set()
+        for faq_id in list(self._documents):
+            faq = incoming.get(faq_id)
+            if faq is None or self._documents[faq_id] != (faq.question, faq.answer):
+                self._remove(faq_id)
+                changed.add(faq_id)
+        for faq_id, faq in incoming.items():
+            if faq_id in self._documents:
+                # Текст не изменился: обновляем только сам объект
+                self._faqs[faq_id] = faq
+            else:
+                self._add(faq)
+                changed.add(faq_id)
+        if changed:
+            self._terms = sorted(self._postings)
+        return len(changed)
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        start = bisect_left(self._terms, prefix)
+        matches = []
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _fuzzy_terms(self, term: str) -> List[Tuple[str, float]]:
+        grams = trigrams(term)
+        counts: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigrams.get(gram, ()):
+                counts[candidate] += 1
+        matches = []
+        for candidate, common in counts.items():
+            similarity = common / (len(grams) + len(trigrams(candidate)) - common)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                matches.append((candidate, similarity))
+        return matches
+
+    def _expand(self, term: str, is_last: bool) -> Dict[str, float]:
+        """Термины индекса, соответствующие слову запроса, с коэффициентом."""
+        expansions: Dict[str, float] = {}
+        if term in self._postings:
+            expansions[term] = 1.0
+        if is_last and len(term) >= 2:
+            for candidate in self._prefix_terms(term):
+                expansions.setdefault(candidate, PREFIX_FACTOR)
+        if not expansions and len(term) >= 3:
+            for candidate, similarity in self._fuzzy_terms(term):
+                expansions[candidate] = FUZZY_FACTOR * similarity
+        return expansions
+
+    def search(self, query: str, limit: int = 50) -> List[FAQ]:
+        """Поиск вопросов по запросу, лучшие совпадения первыми."""
+        words = TOKEN_RE.findall(query.lower().replace("ё", "е"))
+        if not words:
+            return []
+        # Последнее слово без стемминга: по неполному слову основа не строится
+        terms = [self._stem(word, remember=False) for word in words[:-1]] + [words[-1]]
+        total = len(self._documents)
+        scores: Dict[int, float] = defaultdict(float)
+        for position, term in enumerate(terms):
+            is_last = position == len(terms) - 1
+            if is_last and term not in self._postings:
+                stemmed = self._stem(term, remember=False)
+                term = stemmed if stemmed in self._postings else term
+            for candidate, factor in self._expand(term, is_last).items():
+                postings = self._postings[candidate]
+                idf = math.log(1 + total / len(postings))
+                for faq_id, weight in postings.items():
+                    scores[faq_id] += factor * weight * idf
+        phrase = " ".join(words)
+        for faq_id in scores:
+            if phrase in self._documents[faq_id][0].lower().replace("ё", "е"):
+                scores[faq_id] += PHRASE_BONUS
+        ranked = sorted(scores, key=lambda faq_id: (-scores[faq_id], faq_id))
+        return [self._faqs[faq_id] for faq_id in ranked[:limit]]
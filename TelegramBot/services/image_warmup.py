@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from redis.asyncio import Redis
+from redis.exceptions import LockError, RedisError
+from models.catalog import Product
+from services.api_provider import api_provider, redis_registry
+from services.photo_service import ProductPhotoService, photo_service
+from config import (
+    IMAGE_STORAGE_CHAT_ID,
+    IMAGE_WARMUP_CONCURRENCY,
+    IMAGE_WARMUP_SEND_INTERVAL,
+    IMAGE_WARMUP_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Максимальный размер страницы, который отдаёт API каталога
+PAGE_SIZE = 20
+
+
+class ImageWarmupService:
+    """Фоновая предзагрузка фотографий каталога в служебный чат Telegram.
+
+    Обходит каталог через api_provider.catalog и загружает изображения товаров,
+    для которых ещё нет file_id, чтобы первый пользователь не ждал загрузки.
+    Обработанные подкатегории запоминаются в Redis, поэтому прерванный обход
+    продолжается с того же места после перезапуска. Подкатегория считается
+    обработанной, только если все её страницы получены с бэкенда. Обход
+    выполняет один процесс бота: остальные пропускают проход, пока
+    блокировка в Redis занята.
+    """
+
+    DONE_KEY = "warmup:done_subcategories"
+    LOCK_KEY = "warmup:lock"
+    # Блокировка продлевается после каждой загрузки и каждой страницы каталога,
+    # поэтому таймаут должен покрывать одну загрузку с ожиданием retry_after
+    LOCK_TIMEOUT = 600
+
+    def __init__(
+        self,
+        bot: Bot,
+        photos: ProductPhotoService,
+        redis_client: Redis,
+        storage_chat_id: int,
+        concurrency: int,
+        send_interval: float,
+    ) -> None:
+        """Инициализация сервиса.
+
+        Args:
+            bot: Экземпляр бота.
+            photos: Сервис фотографий товаров.
+            redis_client: Общий клиент Redis процесса.
+            storage_chat_id: Приватный чат для загрузки изображений.
+            concurrency: Максимум одновременных загрузок.
+            send_interval: Минимальный интервал между отправками в чат, секунды.
+        """
+        self._bot = bot
+        self._photos = photos
+        self._redis_client = redis_client
+        self._storage_chat_id = storage_chat_id
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._send_interval = send_interval
+        self._send_lock = asyncio.Lock()
+        self._last_send = 0.0
+        self._lock = None
+
+    async def _wait_send_slot(self) -> None:
+        """Ограничение частоты отправок в служебный чат."""
+        async with self._send_lock:
+            delay = self._last_send + self._send_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_send = time.monotonic()
+
+    async def _extend_lock(self) -> None:
+        """Продление блокировки прохода; LockNotOwnedError прерывает проход."""
+        if self._lock is not None:
+            await self._lock.reacquire()
+
+    async def _warm_product(self, product: Product) -> bool:
+        if not product.image_url or await self._photos.get_file_id(product):
+            return False
+        async with self._semaphore:
+            uploaded = await self._upload(product)
+        await self._extend_lock()
+        return uploaded
+
+    async def _upload(self, product: Product) -> bool:
+        while True:
+            await self._wait_send_slot()
+            try:
+                return await self._photos.upload(
+                    self._bot, self._storage_chat_id, product
+                ) is not None
+            except TelegramRetryAfter as e:
+                logger.warning(f"Лимит Telegram, ожидание {e.retry_after} с")
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                logger.error(f"Ошибка предзагрузки фото товара {product.id}: {e}")
+                return False
+
+    async def _warm_subcategory(self, subcategory_id: int) -> Optional[int]:
+        """Предзагрузка фото подкатегории; None, если каталог не удалось получить."""
+        uploaded = 0
+        page, pages = 1, 1
+        while page <= pages:
+            data = await api_provider.catalog.get_products(
+                subcategory_id, page=page, limit=PAGE_SIZE
+            )
+            # API всегда отдаёт хотя бы одну страницу; pages == 0 — ошибка запроса
+            if data["pages"] < 1:
+                logger.warning(
+                    f"Не удалось получить товары подкатегории {subcategory_id}, "
+                    "она будет обработана в следующем проходе"
+                )
+                return None
+            pages = data["pages"]
+            results = await asyncio.gather(
+                *(self._warm_product(product) for product in data["products"])
+            )
+            uploaded += sum(results)
+            await self._extend_lock()
+            page += 1
+        return uploaded
+
+    async def run_once(self) -> int:
+        """Один полный обход каталога под блокировкой.
+
+        Returns:
+            int: Количество загруженных изображений.
+        """
+        lock = self._redis_client.lock(self.LOCK_KEY, timeout=self.LOCK_TIMEOUT)
+        if not await lock.acquire(blocking=False):
+            logger.info("Предзагрузку изображений выполняет другой процесс")
+            return 0
+        self._lock = lock
+        try:
+            return await self._run_locked()
+        finally:
+            self._lock = None
+            try:
+                await lock.release()
+            except LockError:
+                logger.warning("Блокировка предзагрузки истекла до завершения прохода")
+
+    async def _run_locked(self) -> int:
+        uploaded = 0
+        complete = True
+        try:
+            done = await self._redis_client.smembers(self.DONE_KEY)
+        except RedisError as e:
+            logger.warning(f"Не удалось прочитать прогресс предзагрузки: {e}")
+            done = set()
+        categories = await api_provider.catalog.get_categories()
+        if not categories:
+            logger.warning("Каталог недоступен, предзагрузка отложена")
+            return 0
+        for category in categories:
+            subcategories = await api_provider.catalog.get_subcategories(category.id)
+            if not subcategories:
+                # Пустой ответ возможен и при ошибке бэкенда: проход не завершён
+                complete = False
+            for subcategory in subcategories:
+                if str(subcategory.id) in done:
+                    continue
+                result = await self._warm_subcategory(subcategory.id)
+                if result is None:
+                    complete = False
+                    continue
+                uploaded += result
+                await self._redis_client.sadd(self.DONE_KEY, subcategory.id)
+        if complete:
+            # Обход завершён полностью: следующий цикл начинается сначала
+            await self._redis_client.delete(self.DONE_KEY)
+        logger.info(
+            f"Предзагрузка изображений завершена, загружено: {uploaded}"
+            + ("" if complete else " (часть каталога недоступна)")
+        )
+        return uploaded
+
+    async def run_forever(self, interval: float) -> None:
+        """Периодический обход каталога."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка предзагрузки изображений: {e}")
+            await asyncio.sleep(interval)
+
+
+def start_image_warmup(bot: Bot) -> Optional[asyncio.Task]:
+    """Запуск фоновой предзагрузки, если задан служебный чат."""
+    if not IMAGE_STORAGE_CHAT_ID:
+        logger.info("IMAGE_STORAGE_CHAT_ID не задан, предзагрузка изображений отключена")
+        return None
+    service = ImageWarmupService(
+        bot,
+        photo_service,
+        redis_registry.client,
+        int(IMAGE_STORAGE_CHAT_ID),
+        IMAGE_WARMUP_CONCURRENCY,
+        IMAGE_WARMUP_SEND_INTERVAL,
+    )
+    return asyncio.create_task(service.run_forever(IMAGE_WARMUP_INTERVAL))
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from repositories.order_repository import OrderExcelRepository, OrderJournalRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OrderExportService:
+    """Фоновое формирование Excel-отчёта из журнала заказов.
+
+    Отчёт перестраивается в отдельном потоке, только если с прошлого
+    экспорта в журнале появились новые заказы. Перед первым экспортом в
+    журнал однократно переносятся заказы из отчёта старого формата.
+    """
+
+    def __init__(
+        self,
+        journal: OrderJournalRepository,
+        report: OrderExcelRepository,
+        batch_size: int,
+    ) -> None:
+        """Инициализация сервиса.
+
+        Args:
+            journal: Журнал заказов.
+            report: Репозиторий Excel-отчёта.
+            batch_size: Сколько заказов читать из журнала за один запрос.
+        """
+        self._journal = journal
+        self._report = report
+        self._batch_size = batch_size
+        self._exported_seq = 0
+        self._legacy_imported = False
+        # Один поток: экспорты не должны перекрываться
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-export")
+
+    def _import_legacy(self) -> None:
+        imported = self._journal.import_legacy_report(self._report.file_path)
+        if imported:
+            logger.info(f"Из старого отчёта в журнал перенесено заказов: {imported}")
+        self._legacy_imported = True
+
+    def _export(self) -> int:
+        if not self._legacy_imported:
+            self._import_legacy()
+        last_seq = self._journal.last_seq()
+        if last_seq == self._exported_seq:
+            return 0
+        count = self._report.export(self._journal.iter_orders(self._batch_size))
+        if count is None:
+            return 0
+        self._exported_seq = last_seq
+        return count
+
+    async def run_once(self) -> int:
+        """Перестроение отчёта, если в журнале есть новые заказы.
+
+        Returns:
+            int: Количество заказов в новом отчёте (0, если отчёт не менялся).
+        """
+        loop = asyncio.get_running_loop()
+        count = await loop.run_in_executor(self._executor, self._export)
+        if count:
+            logger.info(f"Отчёт по заказам обновлён, заказов: {count}")
+        return count
+
+    async def run_forever(self, interval: float) -> None:
+        """Периодический экспорт; при остановке выполняется последний проход."""
+        try:
+            while True:
+                try:
+                    await self.run_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Ошибка экспорта заказов: {e}")
+                await asyncio.sleep(interval)
+        finally:
+            # Заказы, оформленные перед остановкой, тоже попадают в отчёт
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._export
+                )
+            except Exception as e:
+                logger.error(f"Ошибка финального экспорта заказов: {e}")
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List
+from redis.asyncio import Redis
+from infrastructure.http_client import HttpClient
+from services.api_provider import http_client, redis_registry
+from config import ORDER_OUTBOX_BATCH_SIZE, ORDER_OUTBOX_MAX_BACKOFF
+
+logger = logging.getLogger(__name__)
+
+
+class OrderOutbox:
+    """Очередь заказов в Redis для отправки в Order API бэкенда.
+
+    Оформление заказа только дописывает его в список Redis и не зависит от
+    доступности бэкенда. Фоновая задача отправляет заказы пачками в
+    /api/orders/bulk/ и удаляет их из очереди только после успешного ответа.
+    Ключ идемпотентности — external_id заказа, поэтому повторная отправка
+    пачки после сбоя не создаёт дублей. Одновременно очередь разбирает
+    только один процесс бота (блокировка в Redis).
+    """
+
+    QUEUE_KEY = "orders:outbox"
+    DEAD_KEY = "orders:outbox:dead"
+    LOCK_KEY = "orders:outbox:lock"
+    LOCK_TIMEOUT = 60
+
+    def __init__(self, redis_client: Redis, http_client: HttpClient, batch_size: int) -> None:
+        """Инициализация очереди.
+
+        Args:
+            redis_client: Общий клиент Redis процесса.
+            http_client: HTTP-клиент бэкенда.
+            batch_size: Максимальный размер пачки заказов.
+        """
+        self._redis_client = redis_client
+        self._http_client = http_client
+        self._batch_size = batch_size
+
+    @staticmethod
+    def to_payload(order: Dict[str, Any]) -> Dict[str, Any]:
+        """Преобразование заказа из обработчика в формат Order API."""
+        return {
+            "external_id": order["id"],
+            "user_id": order["user_id"],
+            "total": round(order["total"], 2),
+            "name": order["name"],
+            "address": order["address"],
+            "phone": order["phone"],
+            "status": order["status"],
+            "items": [
+                {
+                    "product_id": item.product.id,
+                    "quantity": item.quantity,
+                    "price": round(item.price, 2),
+                }
+                for item in order["items"]
+            ],
+        }
+
+    async def enqueue(self, order: Dict[str, Any]) -> None:
+        """Постановка заказа в очередь отправки.
+
+        Args:
+            order: Данные заказа.
+        """
+        await self._redis_client.rpush(
+            self.QUEUE_KEY, json.dumps(self.to_payload(order), ensure_ascii=False)
+        )
+
+    async def flush(self) -> int:
+        """Отправка одной пачки заказов из головы очереди.
+
+        Returns:
+            int: Количество заказов, снятых с очереди.
+
+        Raises:
+            Exception: Ошибка бэкенда; пачка остаётся в очереди.
+        """
+        lock = self._redis_client.lock(self.LOCK_KEY, timeout=self.LOCK_TIMEOUT)
+        if not await lock.acquire(blocking=False):
+            return 0
+        try:
+            batch: List[str] = await self._redis_client.lrange(
+                self.QUEUE_KEY, 0, self._batch_size - 1
+            )
+            if not batch:
+                return 0
+            orders = [json.loads(raw) for raw in batch]
+            result = await self._http_client.request(
+                "post", "/api/orders/bulk/", json={"orders": orders}
+            )
+            rejected = {
+                str(item.get("external_id")): item.get("errors")
+                for item in result.get("rejected", [])
+            }
+            async with self._redis_client.pipeline(transaction=True) as pipe:
+                pipe.ltrim(self.QUEUE_KEY, len(batch), -1)
+                # Отклонённые заказы повторять бессмысленно: в отдельный список
+                for order in orders:
+                    if order["external_id"] in rejected:
+                        pipe.rpush(
+                            self.DEAD_KEY,
+                            json.dumps(
+                                {"order": order, "errors": rejected[order["external_id"]]},
+                                ensure_ascii=False,
+                            ),
+                        )
+                await pipe.execute()
+            for external_id, errors in rejected.items():
+                logger.error(f"Бэкенд отклонил заказ {external_id}: {errors}")
+            logger.info(f"Отправлено заказов в бэкенд: {len(result.get('created', []))}")
+            return len(batch)
+        finally:
+            await lock.release()
+
+    async def run_forever(self, interval: float) -> None:
+        """Разбор очереди с экспоненциальной паузой при ошибках бэкенда."""
+        delay = interval
+        while True:
+            try:
+                while await self.flush() == self._batch_size:
+                    pass
+                delay = interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = min(delay * 2, ORDER_OUTBOX_MAX_BACKOFF)
+                logger.error(f"Ошибка отправки заказов, повтор через {delay} с: {e}")
+            await asyncio.sleep(delay)
+
+
+order_outbox = OrderOutbox(redis_registry.client, http_client, ORDER_OUTBOX_BATCH_SIZE)
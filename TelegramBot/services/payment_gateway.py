@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import stripe
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentGatewayError(Exception):
+    """Ошибка платёжного шлюза (сеть, таймаут или отказ провайдера)"""
+
+    pass
+
+
+@dataclass
+class PaymentSession:
+    """Платёжная сессия, созданная шлюзом."""
+
+    id: str
+    url: str
+
+
+class PaymentGateway(ABC):
+    """Асинхронный интерфейс платёжного шлюза."""
+
+    @abstractmethod
+    async def create_session(self, amount: float, order_id: str) -> PaymentSession:
+        """Создание платёжной сессии.
+
+        Args:
+            amount: Сумма в рублях.
+            order_id: Идентификатор заказа (external_id).
+
+        Returns:
+            PaymentSession: Сессия со ссылкой на оплату.
+
+        Raises:
+            PaymentGatewayError: Если сессию создать не удалось.
+        """
+
+    async def close(self) -> None:
+        """Освобождение ресурсов шлюза."""
+
+
+class StripePaymentGateway(PaymentGateway):
+    """Шлюз Stripe на асинхронном HTTP-клиенте с общим пулом соединений.
+
+    Запросы не блокируют цикл событий и выполняются параллельно, число
+    одновременных сессий ограничено только пулом httpx.
+    """
+
+    def __init__(self, secret_key: str, timeout: float, max_retries: int) -> None:
+        """Инициализация шлюза.
+
+        Args:
+            secret_key: Секретный ключ Stripe.
+            timeout: Таймаут одного вызова, секунды.
+            max_retries: Число повторов сетевых ошибок внутри SDK.
+        """
+        self._timeout = timeout
+        self._http_client = stripe.HTTPXClient(timeout=timeout)
+        self._client = stripe.StripeClient(
+            secret_key,
+            http_client=self._http_client,
+            max_network_retries=max_retries,
+        )
+
+    async def create_session(self, amount: float, order_id: str) -> PaymentSession:
+        try:
+            session = await asyncio.wait_for(
+                self._client.checkout.sessions.create_async(
+                    params={
+                        "payment_method_types": ["card"],
+                        "line_items": [
+                            {
+                                "price_data": {
+                                    "currency": "rub",
+                                    "product_data": {"name": "Заказ из Telegram-бота"},
+                                    "unit_amount": int(round(amount * 100)),  # В копейках
+                                },
+                                "quantity": 1,
+                            }
+                        ],
+                        "mode": "payment",
+                        "success_url": f"https://t.me/Market3245bot?start=success_{order_id}",
+                        "cancel_url": f"https://t.me/Market3245bot?start=cancel_{order_id}",
+                        "metadata": {"order_id": order_id},
+                    },
+                    # Повтор с тем же заказом не создаст вторую сессию в Stripe
+                    options={"idempotency_key": f"checkout-{order_id}"},
+                ),
+                # Общий лимит с учётом повторов внутри SDK
+                timeout=self._timeout * 2,
+            )
+        except asyncio.TimeoutError:
+            raise PaymentGatewayError("Платёжный сервис не ответил вовремя")
+        except stripe.StripeError as e:
+            logger.error(f"Ошибка при создании платежной сессии: {e}")
+            raise PaymentGatewayError(str(e))
+        return PaymentSession(id=session.id, url=session.url)
+
+    async def close(self) -> None:
+        await self._http_client.close_async()
+
+
+class FakePaymentGateway(PaymentGateway):
+    """Локальный шлюз без сети для разработки, тестов и нагрузочных прогонов."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Инициализация шлюза.
+
+        Args:
+            latency: Искусственная задержка ответа, секунды.
+        """
+        self._latency = latency
+        self.created = 0
+
+    async def create_session(self, amount: float, order_id: str) -> PaymentSession:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self.created += 1
+        return PaymentSession(
+            id=f"fake_{order_id}", url=f"https://checkout.example.com/pay/{order_id}"
+        )
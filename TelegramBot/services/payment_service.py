@@ -1,22 +1,37 @@
 from typing import Dict, Any
-import stripe
 import logging
-from config import STRIPE_SECRET_KEY
+from config import (
+    PAYMENT_GATEWAY,
+    PAYMENT_TIMEOUT,
+    PAYMENT_MAX_RETRIES,
+    FAKE_PAYMENT_LATENCY,
+    STRIPE_SECRET_KEY,
+)
+from services.payment_gateway import (
+    FakePaymentGateway,
+    PaymentGateway,
+    PaymentGatewayError,
+    StripePaymentGateway,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class PaymentService:
-    """Сервис для работы с платежами через Stripe."""
+    """Сервис для работы с платежами через платёжный шлюз."""
 
     MIN_AMOUNT_RUB = 50.00
 
-    def __init__(self) -> None:
-        """Инициализация сервиса оплаты."""
-        stripe.api_key = STRIPE_SECRET_KEY
+    def __init__(self, gateway: PaymentGateway) -> None:
+        """Инициализация сервиса оплаты.
+
+        Args:
+            gateway: Платёжный шлюз (Stripe или локальный фейк).
+        """
+        self.gateway = gateway
 
     async def create_payment(self, amount: float, order_id: str) -> Dict[str, Any]:
-        """Создание платежной сессии через Stripe."""
+        """Создание платежной сессии."""
         if amount < self.MIN_AMOUNT_RUB:
             logger.warning(
                 f"Сумма {amount} ₽ меньше минимальной ({self.MIN_AMOUNT_RUB} ₽)"
@@ -26,28 +41,18 @@ class PaymentService:
             }
 
         try:
-            session = stripe.checkout.Session.create(
-                payment_method_types=["card"],
-                line_items=[
-                    {
-                        "price_data": {
-                            "currency": "rub",
-                            "product_data": {"name": "Заказ из Telegram-бота"},
-                            "unit_amount": int(amount * 100),  # Сумма в копейках
-                        },
-                        "quantity": 1,
-                    }
-                ],
-                mode="payment",
-                success_url="https://t.me/Market3245bot?start=success_{}".format(
-                    order_id
-                ),
-                cancel_url="https://t.me/Market3245bot?start=cancel_{}".format(
-                    order_id
-                ),
-                metadata={"order_id": order_id},
-            )
-            return {"confirmation_url": session.url}
-        except stripe.error.StripeError as e:
-            logger.error(f"Ошибка при создании платежной сессии: {e}")
+            session = await self.gateway.create_session(amount, order_id)
+            return {"confirmation_url": session.url, "session_id": session.id}
+        except PaymentGatewayError as e:
             return {"error": str(e)}
+
+
+def create_gateway() -> PaymentGateway:
+    """Выбор шлюза по настройке PAYMENT_GATEWAY."""
+    if PAYMENT_GATEWAY == "fake":
+        logger.info("Используется локальный платёжный шлюз")
+        return FakePaymentGateway(FAKE_PAYMENT_LATENCY)
+    return StripePaymentGateway(STRIPE_SECRET_KEY or "", PAYMENT_TIMEOUT, PAYMENT_MAX_RETRIES)
+
+
+payment_service = PaymentService(create_gateway())
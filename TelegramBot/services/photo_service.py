@@ -0,0 +1,158 @@
+import hashlib
+import logging
+from typing import Optional
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import BufferedInputFile, InlineKeyboardMarkup, Message
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from infrastructure.http_client import HttpClient
+from models.catalog import Product
+from services.api_provider import http_client, redis_registry
+from config import PHOTO_FILE_ID_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class ProductPhotoService:
+    """Отправка фотографий товаров с переиспользованием file_id Telegram.
+
+    После первой загрузки изображения Telegram возвращает file_id, который
+    сохраняется в Redis. Повторные просмотры товара отправляют file_id без
+    скачивания и повторной загрузки файла.
+    """
+
+    def __init__(self, redis_client: Redis, http_client: HttpClient) -> None:
+        """Инициализация сервиса.
+
+        Args:
+            redis_client: Общий клиент Redis процесса.
+            http_client: HTTP-клиент для скачивания изображений с бэкенда.
+        """
+        self._redis_client = redis_client
+        self._http_client = http_client
+
+    @staticmethod
+    def image_version(image_url: str) -> str:
+        """Версия изображения: при замене файла в Django меняется его URL."""
+        return hashlib.sha1(image_url.encode()).hexdigest()[:12]
+
+    def _key(self, product: Product) -> str:
+        return f"photo:{product.id}:{self.image_version(product.image_url)}"
+
+    async def get_file_id(self, product: Product) -> Optional[str]:
+        """Получение сохранённого file_id изображения товара."""
+        if not product.image_url:
+            return None
+        try:
+            return await self._redis_client.get(self._key(product))
+        except RedisError as e:
+            logger.warning(f"Не удалось прочитать file_id товара {product.id}: {e}")
+            return None
+
+    async def save_file_id(self, product: Product, file_id: str) -> None:
+        """Сохранение file_id изображения товара."""
+        try:
+            await self._redis_client.set(
+                self._key(product), file_id, ex=PHOTO_FILE_ID_TTL
+            )
+        except RedisError as e:
+            logger.warning(f"Не удалось сохранить file_id товара {product.id}: {e}")
+
+    async def forget(self, product: Product) -> None:
+        """Удаление недействительного file_id."""
+        try:
+            await self._redis_client.delete(self._key(product))
+        except RedisError as e:
+            logger.warning(f"Не удалось удалить file_id товара {product.id}: {e}")
+
+    @staticmethod
+    def download_url(product: Product) -> Optional[str]:
+        """URL для загрузки: уменьшенный под Telegram вариант, если он есть."""
+        return (product.image_variants or {}).get("telegram") or product.image_url
+
+    async def download(self, product: Product) -> Optional[bytes]:
+        """Скачивание изображения товара с бэкенда."""
+        url = self.download_url(product)
+        if not url:
+            return None
+        logger.info(f"Загрузка изображения с URL: {url}")
+        try:
+            return await self._http_client.download(url)
+        except Exception as e:
+            logger.error(f"Ошибка загрузки изображения: {e}")
+            return None
+
+    async def upload(self, bot: Bot, chat_id: int, product: Product) -> Optional[str]:
+        """Загрузка изображения товара в служебный чат для получения file_id.
+
+        Args:
+            bot: Экземпляр бота.
+            chat_id: Идентификатор служебного чата.
+            product: Товар.
+
+        Returns:
+            Optional[str]: file_id или None, если изображение недоступно.
+        """
+        image_data = await self.download(product)
+        if not image_data:
+            return None
+        sent = await bot.send_photo(
+            chat_id=chat_id,
+            photo=BufferedInputFile(file=image_data, filename="product_image.png"),
+            caption=f"product:{product.id}",
+            disable_notification=True,
+        )
+        if not sent.photo:
+            return None
+        file_id = sent.photo[-1].file_id
+        await self.save_file_id(product, file_id)
+        return file_id
+
+    async def send_photo(
+        self,
+        message: Message,
+        product: Product,
+        caption: str,
+        reply_markup: InlineKeyboardMarkup,
+    ) -> bool:
+        """Отправка фотографии товара в чат сообщения.
+
+        Args:
+            message: Сообщение, в чат которого отправляется фото.
+            product: Товар.
+            caption: Подпись к фото.
+            reply_markup: Клавиатура под фото.
+
+        Returns:
+            bool: False, если изображение недоступно и фото не отправлено.
+        """
+        file_id = await self.get_file_id(product)
+        if file_id:
+            try:
+                await message.answer_photo(
+                    photo=file_id,
+                    caption=caption,
+                    reply_markup=reply_markup,
+                    parse_mode="HTML",
+                )
+                return True
+            except TelegramBadRequest as e:
+                logger.warning(f"file_id товара {product.id} недействителен: {e}")
+                await self.forget(product)
+
+        image_data = await self.download(product)
+        if not image_data:
+            return False
+        sent = await message.answer_photo(
+            photo=BufferedInputFile(file=image_data, filename="product_image.png"),
+            caption=caption,
+            reply_markup=reply_markup,
+            parse_mode="HTML",
+        )
+        if sent.photo:
+            await self.save_file_id(product, sent.photo[-1].file_id)
+        return True
+
+
+photo_service = ProductPhotoService(redis_registry.client, http_client)
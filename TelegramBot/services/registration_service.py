@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import List
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from infrastructure.http_client import HttpClient
+from services.api_provider import http_client, redis_registry
+from config import REGISTRATION_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class RegistrationService:
+    """Регистрация пользователей в бэкенде вне критического пути /start.
+
+    Зарегистрированные telegram_id хранятся в Redis-множестве, которое
+    проверяется до любого HTTP-запроса. Новые пользователи попадают в очередь
+    и отправляются в бэкенд пачками фоновой задачей.
+    """
+
+    REGISTERED_KEY = "users:registered"
+    PENDING_KEY = "users:pending_registration"
+
+    def __init__(self, redis_client: Redis, http_client: HttpClient, batch_size: int) -> None:
+        """Инициализация сервиса.
+
+        Args:
+            redis_client: Общий клиент Redis процесса.
+            http_client: HTTP-клиент бэкенда.
+            batch_size: Максимальный размер пачки регистрации.
+        """
+        self._redis_client = redis_client
+        self._http_client = http_client
+        self._batch_size = batch_size
+
+    async def ensure_registered(self, telegram_id: int) -> None:
+        """Постановка пользователя в очередь регистрации, если он ещё не известен.
+
+        Args:
+            telegram_id: Идентификатор пользователя в Telegram.
+        """
+        try:
+            if await self._redis_client.sismember(self.REGISTERED_KEY, telegram_id):
+                return
+            await self._redis_client.sadd(self.PENDING_KEY, telegram_id)
+        except RedisError as e:
+            logger.error(f"Не удалось поставить {telegram_id} в очередь регистрации: {e}")
+
+    async def flush(self) -> int:
+        """Отправка одной пачки ожидающих регистраций в бэкенд.
+
+        Returns:
+            int: Количество зарегистрированных пользователей.
+        """
+        batch: List[str] = await self._redis_client.spop(
+            self.PENDING_KEY, self._batch_size
+        )
+        if not batch:
+            return 0
+        try:
+            await self._http_client.request(
+                "post", "/api/users/register_bulk/", json={"telegram_ids": batch}
+            )
+        except Exception as e:
+            logger.error(f"Ошибка пакетной регистрации ({len(batch)} польз.): {e}")
+            await self._redis_client.sadd(self.PENDING_KEY, *batch)
+            return 0
+        await self._redis_client.sadd(self.REGISTERED_KEY, *batch)
+        logger.info(f"Зарегистрировано пользователей: {len(batch)}")
+        return len(batch)
+
+    async def run_forever(self, interval: float) -> None:
+        """Периодическая отправка очереди регистраций."""
+        while True:
+            try:
+                # Полные пачки отправляем сразу, остаток — на следующем тике
+                while await self.flush() == self._batch_size:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка фоновой регистрации: {e}")
+            await asyncio.sleep(interval)
+
+
+registration_service = RegistrationService(
+    redis_registry.client, http_client, REGISTRATION_BATCH_SIZE
+)
@@ -1,30 +1,113 @@
-from config import REQUIRED_CHANNEL_ID, REQUIRED_GROUP_ID
+from config import (
+    REQUIRED_CHANNEL_ID,
+    REQUIRED_GROUP_ID,
+    SUBSCRIPTION_CACHE_TTL,
+    SUBSCRIPTION_NEGATIVE_CACHE_TTL,
+)
 from aiogram import Bot, Router
+from aiogram.types import ChatMemberUpdated
+from services.api_provider import redis_registry
+from redis.exceptions import RedisError
 
+import asyncio
 import logging
 
 
 router = Router()
 logger = logging.getLogger(__name__)
 
+_redis_client = redis_registry.client
 
-async def check_subscription(bot: Bot, user_id: int) -> bool:
-    """Проверяет, подписан ли пользователь на необходимые каналы и группы"""
+VALID_STATUSES = {"member", "administrator", "creator"}
+
+# Поля хэша subscription:<user_id> -> идентификатор чата
+REQUIRED_CHATS = {"channel": REQUIRED_CHANNEL_ID, "group": REQUIRED_GROUP_ID}
+
+
+def _cache_key(user_id: int) -> str:
+    return f"subscription:{user_id}"
+
+
+def _status_value(status) -> str:
+    return getattr(status, "value", status)
+
+
+async def _save_statuses(user_id: int, statuses: dict, is_valid: bool) -> None:
+    """Сохранение статусов в индекс; отрицательный результат живёт меньше."""
+    ttl = SUBSCRIPTION_CACHE_TTL if is_valid else SUBSCRIPTION_NEGATIVE_CACHE_TTL
+    key = _cache_key(user_id)
     try:
-        # Проверяем подписку на канал
-        channel_member = await bot.get_chat_member(REQUIRED_CHANNEL_ID, user_id)
-        channel_status = channel_member.status
-
-        # Проверяем подписку на группу
-        group_member = await bot.get_chat_member(REQUIRED_GROUP_ID, user_id)
-        group_status = group_member.status
-
-        # Пользователь должен быть участником обоих
-        valid_statuses = ["member", "administrator", "creator"]
-        is_valid = channel_status in valid_statuses and group_status in valid_statuses
-        logger.info(f"Результат проверки подписки: {is_valid}, user_id: {user_id}")
-        return is_valid
-
-    except Exception as e:
-        logger.error(f"Ошибка при проверке подписки: {e}, user_id: {user_id}")
-        return False
+        async with _redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=statuses)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Не удалось сохранить статус подписки {user_id}: {e}")
+
+
+async def check_subscription(bot: Bot, user_id: int, force: bool = False) -> bool:
+    """Проверяет, подписан ли пользователь на необходимые каналы и группы
+
+    При force=True статусы запрашиваются у Telegram без чтения кэша, а кэш
+    обновляется результатом — для явной повторной проверки пользователем.
+    """
+    if force:
+        cached = [None] * len(REQUIRED_CHATS)
+    else:
+        try:
+            cached = await _redis_client.hmget(_cache_key(user_id), list(REQUIRED_CHATS))
+        except RedisError as e:
+            logger.warning(f"Индекс подписок недоступен: {e}")
+            cached = [None] * len(REQUIRED_CHATS)
+    statuses = dict(zip(REQUIRED_CHATS, cached))
+    missing = [name for name, status in statuses.items() if status is None]
+
+    if missing:
+        # Запрашиваем только недостающие статусы, параллельно
+        results = await asyncio.gather(
+            *(bot.get_chat_member(REQUIRED_CHATS[name], user_id) for name in missing),
+            return_exceptions=True,
+        )
+        for name, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Ошибка при проверке подписки ({name}): {result}, user_id: {user_id}"
+                )
+                return False
+            statuses[name] = _status_value(result.status)
+
+    # Пользователь должен быть участником обоих
+    is_valid = all(status in VALID_STATUSES for status in statuses.values())
+    if missing:
+        await _save_statuses(
+            user_id, {name: statuses[name] for name in missing}, is_valid
+        )
+    logger.info(f"Результат проверки подписки: {is_valid}, user_id: {user_id}")
+    return is_valid
+
+
+@router.chat_member()
+async def chat_member_updated(event: ChatMemberUpdated) -> None:
+    """Обновление индекса подписок по событиям chat_member.
+
+    События приходят, только если бот — администратор канала и группы.
+    """
+    for name, chat_id in REQUIRED_CHATS.items():
+        if chat_id and event.chat.id == int(chat_id):
+            user_id = event.new_chat_member.user.id
+            status = _status_value(event.new_chat_member.status)
+            try:
+                statuses = await _redis_client.hgetall(_cache_key(user_id))
+            except RedisError:
+                statuses = {}
+            statuses[name] = status
+            is_valid = len(statuses) == len(REQUIRED_CHATS) and all(
+                value in VALID_STATUSES for value in statuses.values()
+            )
+            await _save_statuses(user_id, {name: status}, is_valid)
+            logger.info(f"Статус подписки обновлён: {name}={status}, user_id: {user_id}")
+            return
+
+
+def register_handlers(dp):
+    dp.include_router(router)